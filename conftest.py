@@ -0,0 +1,115 @@
+"""Shared fixtures for the live-gateway tests in this directory."""
+
+import os
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+EDON_GATEWAY_URL = os.getenv("EDON_GATEWAY_URL", "http://127.0.0.1:8000").rstrip("/")
+EDON_GATEWAY_TOKEN = os.getenv("EDON_GATEWAY_TOKEN") or os.getenv("EDON_API_TOKEN", "test-token")
+EDON_AUTH_ENABLED = os.getenv("EDON_AUTH_ENABLED", "false").lower() == "true"
+# (connect, read) for every live test session: a hung gateway fails the test instead
+# of stalling the suite, and the read budget covers invokes that wait on Clawdbot
+DEFAULT_TIMEOUT = (2, 15)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "live: needs a running gateway at EDON_GATEWAY_URL (deselect with -m 'not live')"
+    )
+    config.addinivalue_line(
+        "markers", "auth_agnostic: live auth test that also runs when EDON_AUTH_ENABLED is off"
+    )
+    # Registered here too so the marker is known when pytest-xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run on the same xdist worker under --dist loadgroup"
+    )
+
+
+class GatewaySession(requests.Session):
+    """Session bound to one gateway; relative paths are resolved against base_url.
+
+    Requests default to DEFAULT_TIMEOUT unless a timeout is passed.
+    """
+
+    timeout = DEFAULT_TIMEOUT
+
+    def __init__(self, base_url: str = EDON_GATEWAY_URL):
+        super().__init__()
+        self.base_url = base_url.rstrip("/")
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith("/"):
+            url = self.base_url + url
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+
+def _gateway_session(token=None, *, base_url=EDON_GATEWAY_URL, headers=None, adapter=None) -> GatewaySession:
+    """Create a keep-alive session, optionally sending X-EDON-TOKEN on every request.
+
+    headers are sent on every request; adapter replaces the default connection pool,
+    e.g. to add retries.
+    """
+    session = GatewaySession(base_url)
+    if adapter is None:
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    if token:
+        session.headers["X-EDON-TOKEN"] = token
+    return session
+
+
+@pytest.fixture(scope="session")
+def gateway_session():
+    """Factory for module-specific sessions (same arguments as _gateway_session).
+
+    Every session it creates is closed when the test session ends.
+    """
+    sessions = []
+
+    def make(token=None, **kwargs):
+        session = _gateway_session(token, **kwargs)
+        sessions.append(session)
+        return session
+
+    yield make
+    for session in sessions:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def http(gateway_session):
+    """Authenticated session shared by every live-gateway test."""
+    return gateway_session(EDON_GATEWAY_TOKEN)
+
+
+@pytest.fixture(scope="session")
+def http_noauth(gateway_session):
+    """Session that never sends a token, for auth-enforcement tests."""
+    return gateway_session()
+
+
+@pytest.fixture(scope="session")
+def auth_enabled():
+    """Whether the gateway under test enforces auth (EDON_AUTH_ENABLED)."""
+    return EDON_AUTH_ENABLED
+
+
+@pytest.fixture(scope="session")
+def gateway_up(http_noauth):
+    """Probe /health once per session and skip live tests if the gateway is down.
+
+    Opt in with ``pytest.mark.usefixtures("gateway_up")``; the unit tests under
+    edon_gateway/test must not depend on a running server.
+    """
+    try:
+        response = http_noauth.get(f"{EDON_GATEWAY_URL}/health", timeout=2)
+    except requests.RequestException as e:
+        pytest.skip(f"Gateway not accessible at {EDON_GATEWAY_URL}: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"Gateway not healthy: HTTP {response.status_code}")
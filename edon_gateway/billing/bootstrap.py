@@ -5,6 +5,7 @@ import hashlib
 
 from ..persistence import get_db
 from ..config import config
+from ..middleware.auth import add_key_prefix
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
@@ -79,15 +80,16 @@ async def create_api_key(request: Request, body: Dict = None):
     key_hash = hashlib.sha256(raw_key.encode()).hexdigest()
 
     db = get_db()
-    api_key = db.create_api_key(
+    api_key_id = db.create_api_key(
         tenant_id=tenant_id,
         name=name,
         key_hash=key_hash
     )
+    add_key_prefix(key_hash)
 
     return {
         "api_key": raw_key,
-        "api_key_id": api_key["id"],
+        "api_key_id": api_key_id,
         "tenant_id": tenant_id,
         "warning": "Store this key now. It will not be shown again."
     }
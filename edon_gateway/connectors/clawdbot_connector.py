@@ -3,8 +3,10 @@ Clawdbot connector - calls Clawdbot Gateway /tools/invoke endpoint.
 """
 
 import os
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Dict, Any, Optional
 
+import httpx
 import requests
 
 from ..persistence import get_db
@@ -176,17 +178,13 @@ class ClawdbotConnector:
         except Exception:
             return resp.text
 
-    def invoke(
+    def _build_payload(
         self,
         tool: str,
-        action: str = "json",
-        args: Optional[Dict[str, Any]] = None,
-        sessionKey: Optional[str] = None,
+        action: str,
+        args: Optional[Dict[str, Any]],
+        sessionKey: Optional[str],
     ) -> Dict[str, Any]:
-        """
-        Invoke a Clawdbot tool via Gateway /tools/invoke endpoint.
-        """
-
         if not self.base_url or not self.secret:
             raise RuntimeError(
                 "Clawdbot connector not configured. "
@@ -200,68 +198,151 @@ class ClawdbotConnector:
         }
         if sessionKey:
             payload["sessionKey"] = sessionKey
+        return payload
 
-        url = f"{self.base_url}/tools/invoke"
-        headers = self._build_headers()
-
-        try:
-            r = requests.post(
-                url,
-                json=payload,     # correct: send object, not a JSON string
-                headers=headers,
-                timeout=30,
+    def _handle_response(self, tool: str, action: str, r: Any) -> Dict[str, Any]:
+        """
+        Turn a Gateway HTTP response (requests or httpx) into an invoke result.
+        """
+        if r.status_code >= 400:
+            detail = self._safe_json(r)
+            self._record_invoke_failure(str(detail))
+            raise RuntimeError(
+                f"Clawdbot Gateway HTTP error {r.status_code}: {detail}"
             )
 
-            if r.status_code >= 400:
-                detail = self._safe_json(r)
-                self._record_invoke_failure(str(detail))
-                raise RuntimeError(
-                    f"Clawdbot Gateway HTTP error {r.status_code}: {detail}"
-                )
-
-            result = self._safe_json(r)
-            if isinstance(result, dict) and result.get("ok"):
-                self._record_invoke_success()
-                return {
-                    "success": True,
-                    "tool": tool,
-                    "action": action,
-                    "result": result.get("result", {}),
-                    "clawdbot_response": result,
-                }
-
-            # Non-ok but not HTTP error
-            if isinstance(result, dict):
-                err = result.get("error", "Unknown Clawdbot error")
-            else:
-                err = str(result)
-            self._record_invoke_failure(err)
+        result = self._safe_json(r)
+        if isinstance(result, dict) and result.get("ok"):
+            self._record_invoke_success()
             return {
-                "success": False,
+                "success": True,
                 "tool": tool,
                 "action": action,
-                "error": err,
-                "clawdbot_response": result if isinstance(result, dict) else None,
+                "result": result.get("result", {}),
+                "clawdbot_response": result,
             }
 
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            self._record_invoke_failure(f"Clawdbot Gateway request failed: {str(e)}")
-            return {
-                "success": False,
-                "tool": tool,
-                "action": action,
-                "error": f"Clawdbot Gateway request failed: {str(e)}",
-                "downstream_unavailable": True,
-            }
+        # Non-ok but not HTTP error
+        if isinstance(result, dict):
+            err = result.get("error", "Unknown Clawdbot error")
+        else:
+            err = str(result)
+        self._record_invoke_failure(err)
+        return {
+            "success": False,
+            "tool": tool,
+            "action": action,
+            "error": err,
+            "clawdbot_response": result if isinstance(result, dict) else None,
+        }
+
+    def _request_failed(self, tool: str, action: str, e: Exception) -> Dict[str, Any]:
+        self._record_invoke_failure(f"Clawdbot Gateway request failed: {str(e)}")
+        return {
+            "success": False,
+            "tool": tool,
+            "action": action,
+            "error": f"Clawdbot Gateway request failed: {str(e)}",
+            "downstream_unavailable": True,
+        }
+
+    def invoke(
+        self,
+        tool: str,
+        action: str = "json",
+        args: Optional[Dict[str, Any]] = None,
+        sessionKey: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Invoke a Clawdbot tool via Gateway /tools/invoke endpoint.
+        """
+        payload = self._build_payload(tool, action, args, sessionKey)
+
+        try:
+            r = _http_session.post(
+                f"{self.base_url}/tools/invoke",
+                json=payload,     # correct: send object, not a JSON string
+                headers=self._build_headers(),
+                timeout=30,
+            )
         except requests.exceptions.RequestException as e:
-            self._record_invoke_failure(f"Clawdbot Gateway request failed: {str(e)}")
-            return {
-                "success": False,
-                "tool": tool,
-                "action": action,
-                "error": f"Clawdbot Gateway request failed: {str(e)}",
-                "downstream_unavailable": True,
-            }
+            return self._request_failed(tool, action, e)
+
+        return self._handle_response(tool, action, r)
+
+    async def ainvoke(
+        self,
+        tool: str,
+        action: str = "json",
+        args: Optional[Dict[str, Any]] = None,
+        sessionKey: Optional[str] = None,
+        timeout: Optional[httpx.Timeout] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of invoke() for use inside request handlers.
+
+        Uses the shared AsyncClient so the event loop is not blocked while
+        waiting on the Gateway. Same payload and result shape as invoke().
+        """
+        payload = self._build_payload(tool, action, args, sessionKey)
+
+        try:
+            r = await get_async_client().post(
+                f"{self.base_url}/tools/invoke",
+                json=payload,
+                headers=self._build_headers(),
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+        except httpx.HTTPError as e:
+            return self._request_failed(tool, action, e)
+
+        return self._handle_response(tool, action, r)
+
+
+# ────────────────────────────────────────────────────────────────
+# Shared HTTP clients
+# ────────────────────────────────────────────────────────────────
+
+# Connectors are built fresh per call (so credential updates apply at once),
+# but the HTTP connections are shared: keep-alive and TLS sessions to each
+# Clawdbot Gateway are reused across invokes and probes.
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+# The clients are shared by every tenant and credential, so they must not keep
+# cookies: a Set-Cookie from one tenant's Gateway call would ride along on the
+# next tenant's call to the same host. An empty allowed_domains rejects them all.
+_REJECT_ALL_COOKIES = DefaultCookiePolicy(allowed_domains=[])
+
+_http_session = requests.Session()
+_http_session.cookies.set_policy(_REJECT_ALL_COOKIES)
+_http_session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_KEEPALIVE_CONNECTIONS))
+_http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_KEEPALIVE_CONNECTIONS))
+
+# Connection probes should fail fast rather than hold a request open
+PROBE_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+# Async client is opened on startup and closed on shutdown
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+            cookies=CookieJar(policy=_REJECT_ALL_COOKIES),
+        )
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared AsyncClient (application shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
 
 
 # ────────────────────────────────────────────────────────────────
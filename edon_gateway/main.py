@@ -12,7 +12,9 @@ from prometheus_client import CONTENT_TYPE_LATEST, generate_latest, Counter, His
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime, UTC
+import asyncio
 import os
+import ssl
 from pathlib import Path
 
 from .governor import EDONGovernor
@@ -20,13 +22,17 @@ from .schemas import Action, Decision, IntentContract, Tool, RiskLevel, Verdict,
 from .audit import AuditLogger
 from .connectors.email_connector import email_connector, EmailConnector
 from .connectors.filesystem_connector import filesystem_connector
-from .connectors.clawdbot_connector import get_clawdbot_connector
-from .middleware import AuthMiddleware, RateLimitMiddleware, ValidationMiddleware, MagValidationMiddleware
+from .connectors.clawdbot_connector import get_clawdbot_connector, get_async_client, close_async_client
+from .middleware import (
+    AuthMiddleware, RateLimitMiddleware, ValidationMiddleware, MagValidationMiddleware,
+    FastBypassMiddleware,
+    run_rate_limit_flusher, RATE_LIMIT_ENABLED,
+)
 from .security.anti_bypass import (
-    AntiBypassConfig, validate_anti_bypass_setup, get_bypass_resistance_score
+    AntiBypassConfig, validate_anti_bypass_setup, get_bypass_resistance_score, SETUP_GUIDES
 )
 from .policy_packs import (
-    get_policy_pack, list_policy_packs, apply_policy_pack, POLICY_PACKS
+    get_policy_pack, list_policy_packs, apply_policy_pack, apply_policy_pack_json, POLICY_PACKS
 )
 from .benchmarking import get_trust_spec_sheet, get_benchmark_collector
 from .logging_config import setup_logging, get_logger
@@ -35,6 +41,7 @@ from .monitoring.metrics import metrics as metrics_collector
 from .tenancy import get_request_tenant_id
 from .routes.integrations import router as integrations_router
 from .routes.integrations import get_integration_status as integrations_account_handler
+from .routes.integrations import invalidate_integration_status_cache
 from .routes.analytics import router as analytics_router
 from .routes.auth import router as auth_router
 
@@ -78,19 +85,27 @@ async def request_id_and_security_headers(request: Request, call_next):
 
 
 # Middleware order matters - add in reverse order of execution
-# Validation first (innermost), then rate limiting, then auth (outermost)
+# Validation first (innermost), then rate limiting, then auth, then the bypass fast path
 
 # Input validation middleware (validates and sanitizes inputs)
 app.add_middleware(ValidationMiddleware)
 
 # Rate limiting middleware (enforces per-agent quotas)
-app.add_middleware(RateLimitMiddleware)
+# Not installed at all when disabled; dispatch would only pass requests through
+if RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
 
 # MAG governance enforcement (requires Auth to resolve tenant)
 app.add_middleware(MagValidationMiddleware)
 
 # Authentication middleware (validates X-EDON-TOKEN header)
-app.add_middleware(AuthMiddleware)
+# Not installed at all when auth is disabled (dev/demo deploys)
+if config.AUTH_ENABLED:
+    app.add_middleware(AuthMiddleware)
+
+# Health/docs fast path (outermost of our own layers): skips auth, rate
+# limiting and validation entirely for load balancer and docs traffic
+app.add_middleware(FastBypassMiddleware)
 
 # Include routers
 app.include_router(integrations_router)
@@ -225,6 +240,9 @@ async def startup_event():
     logger.info(f"Gateway version: {app.version}")
     logger.info("=" * 60)
 
+    # Token hashing (hashlib.sha256) runs on the OpenSSL build Python links
+    logger.info(f"Crypto backend: {ssl.OPENSSL_VERSION}")
+
     from .persistence.schema_version import (
         check_schema_version,
         set_schema_version,
@@ -264,7 +282,29 @@ async def startup_event():
             f"Network gating validation passed: Clawdbot Gateway is {reachability} (risk: {risk})"
         )
 
+    # Periodically persist in-process rate limit counters
+    if RATE_LIMIT_ENABLED:
+        app.state.rate_limit_flusher = asyncio.create_task(run_rate_limit_flusher())
+
+    # Shared async HTTP client for Clawdbot probes (keep-alive across requests)
+    get_async_client()
+
     logger.info("EDON Gateway startup complete")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    flusher = getattr(app.state, "rate_limit_flusher", None)
+    if flusher is not None:
+        flusher.cancel()
+        try:
+            await flusher
+        except asyncio.CancelledError:
+            pass
+
+    await close_async_client()
+
+
 # =========================
 # Request / Response Models
 # =========================
@@ -576,6 +616,18 @@ async def get_anti_bypass_status():
     }
 
 
+@app.get("/security/anti-bypass/guides/{guide_name}")
+async def get_anti_bypass_guide(guide_name: str):
+    """Return an anti-bypass setup guide (network-gating, token-hardening) as plain text."""
+    guide = SETUP_GUIDES.get(guide_name)
+    if guide is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown guide: {guide_name}. Available: {', '.join(SETUP_GUIDES)}"
+        )
+    return Response(content=guide, media_type="text/plain")
+
+
 @app.get("/metrics")
 def metrics():
     if not config.METRICS_ENABLED:
@@ -593,6 +645,13 @@ async def list_available_policy_packs():
     }
 
 
+@app.get("/policy-packs/{pack_name}")
+async def get_policy_pack_intent(pack_name: str):
+    if pack_name not in POLICY_PACKS:
+        raise HTTPException(status_code=404, detail=f"Unknown policy pack: {pack_name}")
+    return Response(content=apply_policy_pack_json(pack_name), media_type="application/json")
+
+
 @app.post("/policy-packs/{pack_name}/apply")
 async def apply_policy_pack_endpoint(
     pack_name: str,
@@ -603,10 +662,11 @@ async def apply_policy_pack_endpoint(
 
     intent_dict = apply_policy_pack(pack_name, objective)
 
-    if "clawdbot" not in intent_dict["scope"]:
-        intent_dict["scope"]["clawdbot"] = []
-    if "invoke" not in intent_dict["scope"]["clawdbot"]:
-        intent_dict["scope"]["clawdbot"].append("invoke")
+    # Pack intents are shared; copy before adding clawdbot.invoke to scope
+    scope = intent_dict["scope"]
+    if "invoke" not in scope.get("clawdbot", []):
+        scope = {**scope, "clawdbot": [*scope.get("clawdbot", []), "invoke"]}
+        intent_dict = {**intent_dict, "scope": scope}
 
     tenant_id = getattr(request.state, "tenant_id", None)
     if tenant_id:
@@ -624,6 +684,7 @@ async def apply_policy_pack_endpoint(
     )
 
     db.set_active_policy_preset(pack_name, applied_by="api")
+    invalidate_integration_status_cache()
 
     return {
         "intent_id": intent_id,
@@ -858,3 +919,18 @@ async def clawdbot_invoke_proxy(
             edon_explanation="Internal execution error",
             details=_details,
         )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop ships with uvicorn[standard] on Linux/macOS; fall back to asyncio elsewhere (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    # Pass the app object: an import string would load this module a second time.
+    # Multi-worker deployments use the uvicorn CLI (see Dockerfile/Procfile).
+    uvicorn.run(app, host=config.HOST, port=config.PORT, loop=loop)
@@ -7,8 +7,18 @@ from .auth import (
     verify_clerk_token,
     resolve_tenant_for_clerk,
 )
+from .bypass import FastBypassMiddleware
 from .mag_validation import MagValidationMiddleware
-from .rate_limit import RateLimitMiddleware, check_rate_limit, increment_rate_limit, ANONYMOUS_LIMITS
+from .rate_limit import (
+    RateLimitMiddleware,
+    check_rate_limit,
+    increment_rate_limit,
+    flush_rate_limit_counters,
+    flush_tenant_usage,
+    run_rate_limit_flusher,
+    ANONYMOUS_LIMITS,
+    RATE_LIMIT_ENABLED,
+)
 from .validation import ValidationMiddleware, validate_action_params, validate_json_structure
 
 __all__ = [
@@ -17,11 +27,16 @@ __all__ = [
     "get_token_from_header",
     "verify_clerk_token",
     "resolve_tenant_for_clerk",
+    "FastBypassMiddleware",
     "MagValidationMiddleware",
     "RateLimitMiddleware",
     "check_rate_limit",
     "increment_rate_limit",
+    "flush_rate_limit_counters",
+    "flush_tenant_usage",
+    "run_rate_limit_flusher",
     "ANONYMOUS_LIMITS",
+    "RATE_LIMIT_ENABLED",
     "ValidationMiddleware",
     "validate_action_params",
     "validate_json_structure",
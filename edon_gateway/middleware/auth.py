@@ -2,29 +2,117 @@
 
 import os
 import logging
+import hashlib
 import json
 import time
+from datetime import date, datetime, UTC
 from typing import Optional, Dict, Any, Tuple
 import uuid
 
+import orjson
 import requests
 import jwt
 
 from fastapi import Request, status
-from fastapi.security import HTTPBearer
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
+from ..billing.plans import check_usage_limit
 from ..config import config
+from ..persistence import get_db
 
 logger = logging.getLogger(__name__)
 
-# Security scheme for OpenAPI docs
-security = HTTPBearer(auto_error=False)
+# Development-only fallback: the env token maps to a fixed dev tenant
+IS_DEVELOPMENT_ENV = os.getenv("EDON_ENV") == "development" or os.getenv("ENVIRONMENT") == "development"
+DEV_TENANT_ID = os.getenv("EDON_DEV_TENANT_ID", "tenant_dev")
+
+# Pre-encoded bodies for the static rejection responses
+_ERR_MISSING_TOKEN = orjson.dumps({
+    "detail": "Missing authentication token. Provide X-EDON-TOKEN header or Authorization Bearer token."
+})
+_ERR_INVALID_TOKEN = orjson.dumps({"detail": "Invalid authentication token"})
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+# 402 bodies keyed by (status, plan), filled lazily
+_SUBSCRIPTION_INACTIVE_BODIES: Dict[Tuple[Optional[str], Optional[str]], bytes] = {}
+
+
+# Skip the last_used_at write if the key was marked used this recently
+API_KEY_LAST_USED_DEBOUNCE_SECONDS = 60
+
+
+def _usage_periods() -> Tuple[str, str]:
+    """Return (today, first day of month) as YYYY-MM-DD strings."""
+    today = date.today()
+    return today.isoformat(), today.replace(day=1).isoformat()
+
+
+def _last_used_is_stale(last_used_at: Optional[str]) -> bool:
+    if not last_used_at:
+        return True
+    try:
+        last_used = datetime.fromisoformat(last_used_at)
+    except ValueError:
+        return True
+    if last_used.tzinfo is None:
+        last_used = last_used.replace(tzinfo=UTC)
+    return (datetime.now(UTC) - last_used).total_seconds() >= API_KEY_LAST_USED_DEBOUNCE_SECONDS
+
+
+def _json_bytes_response(body: bytes, status_code: int, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(content=body, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def _subscription_inactive_body(tenant_status: Optional[str], tenant_plan: Optional[str]) -> bytes:
+    key = (tenant_status, tenant_plan)
+    body = _SUBSCRIPTION_INACTIVE_BODIES.get(key)
+    if body is None:
+        body = orjson.dumps({
+            "detail": f"Subscription inactive. Status: {tenant_status}",
+            "status": tenant_status,
+            "plan": tenant_plan,
+        })
+        _SUBSCRIPTION_INACTIVE_BODIES[key] = body
+    return body
 
 
 _JWKS_CACHE: Dict[str, Any] = {"keys": None, "fetched_at": 0}
 
+# Hash prefixes of every active API key / channel token. Tokens whose hash
+# prefix is absent skip the DB lookups, so garbage-token floods cost no queries.
+# A miss reloads the set at most once per EDON_KEY_PREFIX_REFRESH_SECONDS and
+# is rejected in between. Key-creation paths call add_key_prefix() so a new key
+# works on its next request; a key created by another worker is only seen after
+# that worker's next reload, up to EDON_KEY_PREFIX_REFRESH_SECONDS later.
+_KEY_PREFIX_CACHE: Dict[str, Any] = {"prefixes": None, "fetched_at": 0.0}
+KEY_PREFIX_LENGTH = 8
+KEY_PREFIX_REFRESH_SECONDS = float(os.getenv("EDON_KEY_PREFIX_REFRESH_SECONDS", "1"))
+
+
+def _may_be_db_token(db, key_hash: str) -> bool:
+    """Return False only if no active DB token can match this hash."""
+    prefix = key_hash[:KEY_PREFIX_LENGTH]
+    prefixes = _KEY_PREFIX_CACHE["prefixes"]
+    if prefixes is not None and prefix in prefixes:
+        return True
+
+    now = time.monotonic()
+    if prefixes is not None and now - _KEY_PREFIX_CACHE["fetched_at"] < KEY_PREFIX_REFRESH_SECONDS:
+        return False
+
+    prefixes = db.get_token_hash_prefixes(KEY_PREFIX_LENGTH)
+    _KEY_PREFIX_CACHE["prefixes"] = prefixes
+    _KEY_PREFIX_CACHE["fetched_at"] = now
+    return prefix in prefixes
+
+
+def add_key_prefix(key_hash: str) -> None:
+    """Admit a new API key / channel token hash (call after creating one)."""
+    prefixes = _KEY_PREFIX_CACHE["prefixes"]
+    if prefixes is not None:
+        prefixes.add(key_hash[:KEY_PREFIX_LENGTH])
+
 
 def _get_clerk_jwks(force_refresh: bool = False) -> Optional[list]:
     ttl_seconds = int(os.getenv("CLERK_JWKS_CACHE_TTL", "3600"))
@@ -100,8 +188,6 @@ def verify_clerk_token(token: str) -> Optional[Dict[str, Any]]:
 
 
 def resolve_tenant_for_clerk(claims: Dict[str, Any], fallback_email: Optional[str] = None) -> Dict[str, Any]:
-    from ..persistence import get_db
-
     db = get_db()
     clerk_sub = (claims or {}).get("sub")
     if not clerk_sub:
@@ -149,6 +235,7 @@ def verify_token(token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
       - status
       - plan
       - api_key_id
+      - monthly_usage / daily_usage (API keys only; fetched with the key)
     or None if legacy token/no tenant.
     """
     if not config.AUTH_ENABLED:
@@ -160,26 +247,26 @@ def verify_token(token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
 
     # 1) DB lookup first (tenant-scoped API keys + channel tokens)
     try:
-        import hashlib
-        from ..persistence import get_db
-
         key_hash = hashlib.sha256(token.encode()).hexdigest()
         db = get_db()
-        api_key = db.get_api_key_by_hash(key_hash)
+        known = _may_be_db_token(db, key_hash)
+        bundle = db.get_auth_bundle(key_hash, *_usage_periods()) if known else None
 
-        if api_key:
-            db.update_api_key_last_used(api_key["id"])
-            tenant = db.get_tenant(api_key["tenant_id"])
-            if tenant:
+        if bundle:
+            if _last_used_is_stale(bundle["api_key_last_used_at"]):
+                db.update_api_key_last_used(bundle["api_key_id"])
+            if bundle["tenant_id"]:
                 return True, {
-                    "tenant_id": tenant["id"],
-                    "status": tenant["status"],
-                    "plan": tenant["plan"],
-                    "api_key_id": api_key["id"],
+                    "tenant_id": bundle["tenant_id"],
+                    "status": bundle["status"],
+                    "plan": bundle["plan"],
+                    "api_key_id": bundle["api_key_id"],
+                    "monthly_usage": bundle["monthly_usage"],
+                    "daily_usage": bundle["daily_usage"],
                 }
             return False, None
 
-        channel_token = db.get_channel_token_by_hash(key_hash)
+        channel_token = db.get_channel_token_by_hash(key_hash) if known else None
         if channel_token:
             db.update_channel_token_last_used(channel_token["id"])
             tenant = db.get_tenant(channel_token["tenant_id"])
@@ -221,34 +308,49 @@ def verify_token(token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
     return False, None
 
 
-def get_token_from_header(request: Request) -> Optional[str]:
-    """Extract token from headers.
+def _extract_token(raw_headers) -> Optional[str]:
+    """Extract token from raw ASGI headers in a single pass.
 
-    Primary: X-EDON-TOKEN
-    Fallback: Authorization: Bearer <token>
+    ASGI header names are already lowercased bytes, so this avoids building
+    a Starlette Headers object. First occurrence of each header wins.
     """
-    token = request.headers.get("X-EDON-TOKEN")
-    if token:
-        token = token.strip()
+    edon_token = None
+    auth_header = None
+    for name, value in raw_headers:
+        if name == b"x-edon-token":
+            if edon_token is None:
+                edon_token = value
+        elif name == b"authorization":
+            if auth_header is None:
+                auth_header = value
+
+    if edon_token:
+        token = edon_token.decode("latin-1").strip()
         return token if token else None
 
-    auth_header = (request.headers.get("Authorization", "") or "").strip()
-    if auth_header.startswith("Bearer "):
-        bearer = auth_header[7:].strip()
-        return bearer if bearer else None
+    if auth_header:
+        auth_value = auth_header.decode("latin-1").strip()
+        if auth_value.startswith("Bearer "):
+            bearer = auth_value[7:].strip()
+            return bearer if bearer else None
 
     return None
 
 
+def get_token_from_header(request: Request) -> Optional[str]:
+    """Extract token from headers.
+
+    Primary: X-EDON-TOKEN
+    Fallback: Authorization: Bearer <token>
+    """
+    return _extract_token(request.scope["headers"])
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
     """Middleware to validate authentication token."""
 
+    # Health and docs endpoints never reach this layer (see FastBypassMiddleware)
     PUBLIC_ENDPOINTS = {
-        "/health",
-        "/healthz",
-        "/docs",
-        "/openapi.json",
-        "/redoc",
         "/debug/auth-public",
         "/auth/signup",
         "/auth/session",
@@ -271,22 +373,12 @@ class AuthMiddleware(BaseHTTPMiddleware):
         token = get_token_from_header(request)
 
         if not token:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "detail": "Missing authentication token. Provide X-EDON-TOKEN header or Authorization Bearer token."
-                },
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            return _json_bytes_response(_ERR_MISSING_TOKEN, status.HTTP_401_UNAUTHORIZED, _BEARER_CHALLENGE)
 
         is_valid, tenant_info = verify_token(token)
 
         if not is_valid:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid authentication token"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            return _json_bytes_response(_ERR_INVALID_TOKEN, status.HTTP_401_UNAUTHORIZED, _BEARER_CHALLENGE)
 
         # Tenant-scoped behavior
         if tenant_info:
@@ -300,44 +392,41 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 tenant_status = "active"
             else:
                 if tenant_status not in ["active", "trial"]:
-                    return JSONResponse(
-                        status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                        content={
-                            "detail": f"Subscription inactive. Status: {tenant_status}",
-                            "status": tenant_status,
-                            "plan": tenant_plan,
-                        },
+                    return _json_bytes_response(
+                        _subscription_inactive_body(tenant_status, tenant_plan),
+                        status.HTTP_402_PAYMENT_REQUIRED,
                     )
 
             # Usage limits
             try:
-                from ..billing.plans import check_usage_limit
-                from ..persistence import get_db
-                from datetime import date
-
                 db = get_db()
                 tenant_id = tenant_info["tenant_id"]
 
-                monthly_usage = db.get_tenant_usage(tenant_id)
+                # API key lookups already carry usage; other token types need one query
+                monthly_usage = tenant_info.get("monthly_usage")
+                daily_usage = tenant_info.get("daily_usage")
+                if monthly_usage is None or daily_usage is None:
+                    usage = db.get_tenant_usage_summary(tenant_id, *_usage_periods())
+                    monthly_usage, daily_usage = usage["monthly"], usage["daily"]
+
                 if not check_usage_limit(tenant_plan, monthly_usage, "month"):
-                    return JSONResponse(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        content={
+                    return _json_bytes_response(
+                        orjson.dumps({
                             "detail": f"Monthly usage limit exceeded for plan '{tenant_plan}'",
                             "plan": tenant_plan,
                             "usage": monthly_usage,
-                        },
+                        }),
+                        status.HTTP_429_TOO_MANY_REQUESTS,
                     )
 
-                daily_usage = db.get_tenant_usage(tenant_id, date.today().isoformat())
                 if not check_usage_limit(tenant_plan, daily_usage, "day"):
-                    return JSONResponse(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        content={
+                    return _json_bytes_response(
+                        orjson.dumps({
                             "detail": f"Daily usage limit exceeded for plan '{tenant_plan}'",
                             "plan": tenant_plan,
                             "usage": daily_usage,
-                        },
+                        }),
+                        status.HTTP_429_TOO_MANY_REQUESTS,
                     )
 
                 request.state.tenant_id = tenant_id
@@ -350,16 +439,14 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 pass
 
         elif (
-            (os.getenv("EDON_ENV") == "development" or os.getenv("ENVIRONMENT") == "development")
+            IS_DEVELOPMENT_ENV
             and token == (config.API_TOKEN or "").strip()
             and not getattr(request.state, "tenant_id", None)
         ):
-            request.state.tenant_id = os.getenv("EDON_DEV_TENANT_ID", "tenant_dev")
+            request.state.tenant_id = DEV_TENANT_ID
 
         # Token → agent_id binding
         if config.TOKEN_BINDING_ENABLED:
-            from ..persistence import get_db
-
             db = get_db()
             agent_id = request.query_params.get("agent_id") or request.headers.get("X-Agent-ID") or None
 
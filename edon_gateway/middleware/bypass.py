@@ -0,0 +1,42 @@
+"""Fast-path bypass for public health and docs endpoints."""
+
+import re
+
+from .auth import AuthMiddleware
+from .mag_validation import MagValidationMiddleware
+from .rate_limit import RateLimitMiddleware
+from .validation import ValidationMiddleware
+
+# Public liveness and docs endpoints; load balancers and dashboards poll these continuously
+_BYPASS_RE = re.compile(rb"^/(health|healthz|docs|openapi\.json|redoc|integrations/health)/?$")
+
+# Layers skipped for bypassed paths
+_BYPASSED_MIDDLEWARE = (
+    AuthMiddleware,
+    RateLimitMiddleware,
+    MagValidationMiddleware,
+    ValidationMiddleware,
+)
+
+
+class FastBypassMiddleware:
+    """Route public endpoints straight past auth, rate limiting and validation.
+
+    Must be added after (i.e. outside) those middlewares. On construction it
+    walks the already-built inner stack past every bypassable layer, so
+    matching requests go directly to the first layer that is not skipped.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        inner = app
+        while isinstance(inner, _BYPASSED_MIDDLEWARE):
+            inner = inner.app
+        self.bypass_app = inner
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            raw_path = scope.get("raw_path") or scope["path"].encode()
+            if _BYPASS_RE.match(raw_path):
+                return await self.bypass_app(scope, receive, send)
+        return await self.app(scope, receive, send)
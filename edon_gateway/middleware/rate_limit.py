@@ -2,11 +2,15 @@
 
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
-from datetime import datetime, UTC
-from typing import Optional
+from starlette.responses import Response
+from collections import defaultdict
+from typing import Dict, Optional
+import asyncio
 import logging
 import os
+import time
+
+import orjson
 
 from ..persistence import get_db
 from ..config import config
@@ -49,28 +53,42 @@ POLLING_ENDPOINT_LIMITS = {
 }
 
 
-def get_rate_limit_key(agent_id: str, window: str) -> str:
+# Seconds per rate limit window; counter keys bucket on epoch // window size
+WINDOW_SECONDS = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+# Counters are kept per process and flushed to the database periodically.
+# Each worker adds its own unflushed hits on top of the last DB snapshot, so
+# with N workers a limit can be overshot by at most N flush intervals of traffic.
+FLUSH_INTERVAL_SECONDS = float(os.getenv("EDON_RATE_LIMIT_FLUSH_SECONDS", "2"))
+
+_local_counts: Dict[str, int] = defaultdict(int)  # Unflushed hits per counter key
+_db_snapshot: Dict[str, int] = {}  # Last known DB value per counter key
+_tenant_usage: Dict[str, int] = defaultdict(int)  # Unflushed successful requests per tenant
+
+
+def get_rate_limit_key(agent_id: str, window: str, now: Optional[int] = None) -> str:
     """Generate rate limit counter key.
     
     Args:
         agent_id: Agent identifier
         window: Time window (minute, hour, day)
+        now: Epoch seconds to bucket on (defaults to current time)
         
     Returns:
         Counter key string
     """
-    now = datetime.now(UTC)
-    
-    if window == "minute":
-        time_key = now.strftime("%Y%m%d%H%M")
-    elif window == "hour":
-        time_key = now.strftime("%Y%m%d%H")
-    elif window == "day":
-        time_key = now.strftime("%Y%m%d")
-    else:
+    window_seconds = WINDOW_SECONDS.get(window)
+    if window_seconds is None:
         raise ValueError(f"Invalid window: {window}")
     
-    return f"rate_limit:{agent_id}:{window}:{time_key}"
+    if now is None:
+        now = int(time.time())
+    
+    return f"rate_limit:{agent_id}:{window}:{now // window_seconds}"
 
 
 def check_rate_limit(agent_id: str, limits: Optional[dict] = None) -> tuple[bool, Optional[str]]:
@@ -89,17 +107,24 @@ def check_rate_limit(agent_id: str, limits: Optional[dict] = None) -> tuple[bool
     if limits is None:
         limits = DEFAULT_LIMITS
     
-    db = get_db()
+    now = int(time.time())
     
-    # Check each time window
+    # Resolve the counter key for each configured time window
+    window_limits = []
     for window, limit in limits.items():
         if not window.startswith("per_"):
             continue
         
-        window_name = window.replace("per_", "")
-        counter_key = get_rate_limit_key(agent_id, window_name)
-        current_count = db.get_counter(counter_key)
-        
+        window_name = window[4:]
+        window_limits.append((window_name, limit, get_rate_limit_key(agent_id, window_name, now)))
+    
+    # Only go to the DB for keys this process has not seen yet (new window buckets)
+    missing = [counter_key for _, _, counter_key in window_limits if counter_key not in _db_snapshot]
+    if missing:
+        _db_snapshot.update(get_db().get_counters(missing))
+    
+    for window_name, limit, counter_key in window_limits:
+        current_count = _db_snapshot[counter_key] + _local_counts.get(counter_key, 0)
         if current_count >= limit:
             return False, f"Rate limit exceeded: {limit} requests per {window_name}"
     
@@ -115,23 +140,119 @@ def increment_rate_limit(agent_id: str):
     if not RATE_LIMIT_ENABLED:
         return
     
+    now = int(time.time())
+    
+    # Count locally; flush_rate_limit_counters() persists the deltas
+    for window in WINDOW_SECONDS:
+        _local_counts[get_rate_limit_key(agent_id, window, now)] += 1
+
+
+def flush_rate_limit_counters():
+    """Persist locally accumulated rate limit hits and refresh the DB snapshot.
+    
+    Expired window buckets are dropped from the snapshot so it stays bounded.
+    """
+    global _local_counts
+    
+    deltas, _local_counts = _local_counts, defaultdict(int)
+    now = int(time.time())
+    
+    live_keys = set(deltas)
+    for counter_key in list(_db_snapshot):
+        _, window, bucket = counter_key.rsplit(":", 2)
+        if int(bucket) == now // WINDOW_SECONDS[window]:
+            live_keys.add(counter_key)
+        else:
+            del _db_snapshot[counter_key]
+    
+    if not live_keys:
+        return
+    
     db = get_db()
+    try:
+        db.increment_counters(list(deltas.items()))
+    except Exception as e:
+        # Keep the hits so the next flush retries them
+        logger.error(f"Failed to flush rate limit counters: {e}")
+        for counter_key, count in deltas.items():
+            _local_counts[counter_key] += count
+        return
+    
+    _db_snapshot.update(db.get_counters(list(live_keys)))
+
+
+def flush_tenant_usage():
+    """Persist locally accumulated per-tenant usage in one batch."""
+    global _tenant_usage
+    
+    deltas, _tenant_usage = _tenant_usage, defaultdict(int)
+    if not deltas:
+        return
     
-    # Increment all time windows
-    for window in ["minute", "hour", "day"]:
-        counter_key = get_rate_limit_key(agent_id, window)
-        db.increment_counter(counter_key, 1)
+    try:
+        get_db().increment_tenant_usages(list(deltas.items()))
+    except Exception as e:
+        # Keep the usage so the next flush retries it
+        logger.error(f"Failed to flush tenant usage: {e}")
+        for tenant_id, count in deltas.items():
+            _tenant_usage[tenant_id] += count
+
+
+async def run_rate_limit_flusher(interval: float = FLUSH_INTERVAL_SECONDS):
+    """Flush rate limit counters every `interval` seconds until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                flush_rate_limit_counters()
+                flush_tenant_usage()
+            except Exception as e:
+                logger.error(f"Rate limit flush failed: {e}")
+    finally:
+        # Persist whatever is left on shutdown
+        try:
+            flush_rate_limit_counters()
+            flush_tenant_usage()
+        except Exception as e:
+            logger.error(f"Final rate limit flush failed: {e}")
+
+
+# Pre-encoded 429 bodies keyed by error message; only a handful of
+# limit/window/anonymous combinations exist, so this stays small
+_RATE_LIMIT_BODIES: Dict[str, tuple] = {}
+
+
+def _rate_limit_response(error_msg: str) -> Response:
+    """Build a 429 response from a cached pre-encoded body."""
+    cached = _RATE_LIMIT_BODIES.get(error_msg)
+    if cached is None:
+        # Calculate retry-after based on which limit was hit
+        retry_after = "60"  # Default 60 seconds
+        if "per_minute" in error_msg:
+            retry_after = "60"  # Wait 1 minute
+        elif "per_hour" in error_msg:
+            retry_after = "3600"  # Wait 1 hour
+        elif "per_day" in error_msg:
+            retry_after = "86400"  # Wait 1 day
+        
+        cached = (orjson.dumps({"detail": error_msg}), retry_after)
+        _RATE_LIMIT_BODIES[error_msg] = cached
+    
+    body, retry_after = cached
+    return Response(
+        content=body,
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={"Retry-After": retry_after},
+        media_type="application/json",
+    )
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Middleware to enforce rate limiting per agent."""
     
     # Endpoints that don't count toward rate limits
+    # (health and docs are handled by FastBypassMiddleware before this layer)
     EXCLUDED_ENDPOINTS = {
-        "/health",
-        "/docs",
-        "/openapi.json",
-        "/redoc",
         "/metrics",
         "/stats"
     }
@@ -209,20 +330,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             if is_anonymous:
                 error_msg = f"{error_msg}. Anonymous requests are heavily rate-limited. Provide agent_id in X-Agent-ID header or query parameter."
             
-            # Calculate retry-after based on which limit was hit
-            retry_after = "60"  # Default 60 seconds
-            if "per_minute" in error_msg:
-                retry_after = "60"  # Wait 1 minute
-            elif "per_hour" in error_msg:
-                retry_after = "3600"  # Wait 1 hour
-            elif "per_day" in error_msg:
-                retry_after = "86400"  # Wait 1 day
-            
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={"detail": error_msg},
-                headers={"Retry-After": retry_after},
-            )
+            return _rate_limit_response(error_msg)
         
         # Process request
         response = await call_next(request)
@@ -232,9 +340,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             increment_rate_limit(rate_limit_key)
             
             # Track tenant usage if tenant-scoped request
-            if hasattr(request.state, 'tenant_id'):
-                from ..persistence import get_db
-                db = get_db()
-                db.increment_tenant_usage(request.state.tenant_id, 1)
+            # (request.state is backed by scope["state"]; a dict get avoids hasattr)
+            # Counted locally and written in batches by run_rate_limit_flusher,
+            # so no DB write sits between the response and the client
+            tenant_id = request.scope.get("state", {}).get("tenant_id")
+            if tenant_id is not None:
+                _tenant_usage[tenant_id] += 1
         
         return response
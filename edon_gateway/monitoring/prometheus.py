@@ -1,7 +1,21 @@
 """Prometheus metrics integration."""
 
-from typing import Dict, Any, Optional
-from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _label_key_for_items(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Convert label items to a key string (memoized; label sets repeat)."""
+    return ",".join(f"{k}={v}" for k, v in sorted(items))
+
+
+@lru_cache(maxsize=1024)
+def _type_line(name: str, kind: str) -> bytes:
+    """Encoded `# TYPE` header line for a metric."""
+    return f"# TYPE {name} {kind}\n".encode()
 
 
 class PrometheusMetrics:
@@ -9,57 +23,71 @@ class PrometheusMetrics:
     
     def __init__(self):
         """Initialize Prometheus metrics."""
-        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-        self._gauges: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        self._histograms: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        # Flat storage keyed by (metric name, label key).
+        # Histograms keep only a running sum and count per series.
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._gauges: Dict[Tuple[str, str], float] = {}
+        self._histogram_sums: Dict[Tuple[str, str], float] = {}
+        self._histogram_counts: Dict[Tuple[str, str], int] = {}
+        self._prefixes: Dict[Tuple[str, str], bytes] = {}
     
     def _label_key(self, labels: Optional[Dict[str, str]]) -> str:
         """Convert labels dict to key string."""
         if not labels:
             return ""
-        return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        return _label_key_for_items(tuple(labels.items()))
     
     def increment_counter(self, name: str, labels: Optional[Dict[str, str]] = None):
         """Increment a counter."""
-        key = self._label_key(labels)
-        self._counters[name][key] += 1
+        key = (name, self._label_key(labels))
+        self._counters[key] = self._counters.get(key, 0) + 1
     
     def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge value."""
-        key = self._label_key(labels)
-        self._gauges[name][key] = value
+        self._gauges[(name, self._label_key(labels))] = value
     
     def observe_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Observe a histogram value."""
-        key = self._label_key(labels)
-        self._histograms[name][key].append(value)
+        key = (name, self._label_key(labels))
+        self._histogram_sums[key] = self._histogram_sums.get(key, 0) + value
+        self._histogram_counts[key] = self._histogram_counts.get(key, 0) + 1
     
-    def get_metrics(self) -> str:
-        """Get metrics in Prometheus format."""
-        lines = []
+    def _series_prefix(self, name: str, labels: str) -> bytes:
+        """Encoded `name{labels} ` prefix for a series (cached per series)."""
+        key = (name, labels)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            label_str = f"{{{labels}}}" if labels else ""
+            prefix = self._prefixes[key] = f"{name}{label_str} ".encode()
+        return prefix
+    
+    def get_metrics_bytes(self) -> bytes:
+        """Get metrics in Prometheus format as bytes.
         
-        # Counters
-        for name, labels_dict in self._counters.items():
-            for labels, value in labels_dict.items():
-                label_str = f"{{{labels}}}" if labels else ""
-                lines.append(f"# TYPE {name} counter")
-                lines.append(f"{name}{label_str} {value}")
+        Series are grouped by metric name so each `# TYPE` line is emitted once.
+        """
+        buf = bytearray()
         
-        # Gauges
-        for name, labels_dict in self._gauges.items():
-            for labels, value in labels_dict.items():
-                label_str = f"{{{labels}}}" if labels else ""
-                lines.append(f"# TYPE {name} gauge")
-                lines.append(f"{name}{label_str} {value}")
+        for kind, series in (("counter", self._counters), ("gauge", self._gauges)):
+            for name, keys in groupby(sorted(series), key=itemgetter(0)):
+                buf += _type_line(name, kind)
+                for key in keys:
+                    buf += self._series_prefix(name, key[1])
+                    buf += str(series[key]).encode()
+                    buf += b"\n"
         
         # Histograms (simplified - just sum and count)
-        for name, labels_dict in self._histograms.items():
-            for labels, values in labels_dict.items():
-                if values:
-                    label_str = f"{{{labels}}}" if labels else ""
-                    lines.append(f"# TYPE {name}_sum counter")
-                    lines.append(f"{name}_sum{label_str} {sum(values)}")
-                    lines.append(f"# TYPE {name}_count counter")
-                    lines.append(f"{name}_count{label_str} {len(values)}")
+        for name, keys in groupby(sorted(self._histogram_counts), key=itemgetter(0)):
+            keys = list(keys)
+            for suffix, values in (("_sum", self._histogram_sums), ("_count", self._histogram_counts)):
+                buf += _type_line(f"{name}{suffix}", "counter")
+                for key in keys:
+                    buf += self._series_prefix(f"{name}{suffix}", key[1])
+                    buf += str(values[key]).encode()
+                    buf += b"\n"
         
-        return "\n".join(lines) if lines else "# No metrics collected yet"
+        return bytes(buf[:-1]) if buf else b"# No metrics collected yet"
+    
+    def get_metrics(self) -> str:
+        """Get metrics in Prometheus format."""
+        return self.get_metrics_bytes().decode()
@@ -749,10 +749,57 @@ class Database:
             cursor.execute("SELECT value FROM counters WHERE key = ?", (key,))
             row = cursor.fetchone()
             return row["value"] if row else 0
-    
+
+    def increment_counters(self, amounts: List[tuple]) -> None:
+        """Increment several counters in a single transaction.
+
+        Args:
+            amounts: List of (key, amount) pairs
+        """
+        if not amounts:
+            return
+
+        now = datetime.now(UTC).isoformat()
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO counters (key, value, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = value + excluded.value,
+                    updated_at = excluded.updated_at
+            """, [(key, amount, now) for key, amount in amounts])
+            conn.commit()
+
+    def get_counters(self, keys: List[str]) -> Dict[str, int]:
+        """Get several counter values in a single query.
+
+        Args:
+            keys: Counter keys
+
+        Returns:
+            Dict mapping every requested key to its value (0 if not found)
+        """
+        counts = {key: 0 for key in keys}
+        if not counts:
+            return counts
+
+        placeholders = ",".join("?" * len(counts))
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT key, value FROM counters WHERE key IN ({placeholders})",
+                tuple(counts),
+            )
+            for row in cursor.fetchall():
+                counts[row["key"]] = row["value"]
+            return counts
+
     def save_credential(self, credential_id: str, tool_name: str, 
                       credential_type: str, credential_data: Dict[str, Any],
-                      encrypted: bool = False, tenant_id: Optional[str] = None) -> None:
+                      encrypted: bool = False, tenant_id: Optional[str] = None,
+                      mark_ok: bool = False) -> None:
         """Save or update a credential.
         
         Args:
@@ -760,8 +807,11 @@ class Database:
             tool_name: Tool name (e.g., "email", "filesystem", "clawdbot")
             credential_type: Type of credential (e.g., "smtp", "api_key", "gateway")
             credential_data: Credential data dictionary
-            encrypted: Whether credential_data is encrypted
+            encrypted: Flag stored with the row; credential_data is written
+                as given (no encryption or key derivation happens here)
             tenant_id: Optional tenant ID for tenant-scoped credentials
+            mark_ok: Also record a successful check (same as
+                update_credential_status(success=True)) in the same write
             
         Raises:
             ValueError: If validation fails
@@ -783,13 +833,14 @@ class Database:
                 cursor.execute("""
                     INSERT OR REPLACE INTO credentials 
                     (credential_id, tool_name, tenant_id, credential_type, credential_data,
-                     encrypted, created_at, updated_at)
+                     encrypted, created_at, updated_at, last_used_at)
                     VALUES (?, ?, ?, ?, ?, ?, 
-                            COALESCE((SELECT created_at FROM credentials WHERE credential_id = ? AND (tenant_id = ? OR (tenant_id IS NULL AND ? IS NULL))), ?), ?)
+                            COALESCE((SELECT created_at FROM credentials WHERE credential_id = ? AND (tenant_id = ? OR (tenant_id IS NULL AND ? IS NULL))), ?), ?, ?)
                 """, (
                     credential_id, tool_name, tenant_id, credential_type,
                     json.dumps(credential_data), 1 if encrypted else 0,
-                    credential_id, tenant_id, tenant_id, now, now
+                    credential_id, tenant_id, tenant_id, now, now,
+                    now if mark_ok else None
                 ))
                 conn.commit()
         except sqlite3.Error as e:
@@ -1622,6 +1673,24 @@ class Database:
                 }
             return None
     
+    def get_token_hash_prefixes(self, length: int = 8) -> set:
+        """Get hash prefixes of all active API keys and channel tokens.
+        
+        Args:
+            length: Number of leading hex characters to keep
+            
+        Returns:
+            Set of hash prefixes
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT substr(key_hash, 1, ?) AS prefix FROM api_keys WHERE status = 'active'
+                UNION
+                SELECT substr(token_hash, 1, ?) AS prefix FROM channel_tokens WHERE status = 'active'
+            """, (length, length))
+            return {row["prefix"] for row in cursor.fetchall()}
+    
     def update_api_key_last_used(self, api_key_id: str):
         """Update API key last used timestamp.
         
@@ -1913,6 +1982,32 @@ class Database:
             
             conn.commit()
     
+    def increment_tenant_usages(self, amounts: List[tuple], period_start: Optional[str] = None) -> None:
+        """Increment usage for several tenants in a single transaction.
+        
+        Tenants that no longer exist are skipped rather than failing the batch.
+        
+        Args:
+            amounts: List of (tenant_id, count) pairs
+            period_start: Period start date (YYYY-MM-DD), defaults to today
+        """
+        if not amounts:
+            return
+        
+        from datetime import date
+        if period_start is None:
+            period_start = date.today().isoformat()
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO tenant_usage (tenant_id, period_start, requests_count)
+                SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM tenants WHERE id = ?)
+                ON CONFLICT(tenant_id, period_start) DO UPDATE SET
+                    requests_count = requests_count + excluded.requests_count
+            """, [(tenant_id, period_start, count, tenant_id) for tenant_id, count in amounts])
+            conn.commit()
+    
     def get_tenant_usage(self, tenant_id: str, period_start: Optional[str] = None) -> int:
         """Get tenant usage for a period.
         
@@ -1937,6 +2032,63 @@ class Database:
             row = cursor.fetchone()
             return row["requests_count"] if row else 0
 
+    def get_tenant_usage_summary(self, tenant_id: str, today: str, month_start: str) -> Dict[str, int]:
+        """Get a tenant's usage for the current day and month in one query.
+        
+        Args:
+            tenant_id: Tenant identifier
+            today: Current date (YYYY-MM-DD)
+            month_start: First day of the current month (YYYY-MM-DD)
+            
+        Returns:
+            Dict with "monthly" and "daily" request counts
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    COALESCE(SUM(requests_count), 0) AS monthly_usage,
+                    COALESCE(SUM(CASE WHEN period_start = ? THEN requests_count END), 0) AS daily_usage
+                FROM tenant_usage
+                WHERE tenant_id = ? AND period_start >= ? AND period_start <= ?
+            """, (today, tenant_id, month_start, today))
+            row = cursor.fetchone()
+            return {"monthly": row["monthly_usage"], "daily": row["daily_usage"]}
+
+    def get_auth_bundle(self, key_hash: str, today: str, month_start: str) -> Optional[Dict[str, Any]]:
+        """Resolve an API key hash to its key, tenant and current usage in one query.
+        
+        Args:
+            key_hash: SHA256 hash of the API key
+            today: Current date (YYYY-MM-DD)
+            month_start: First day of the current month (YYYY-MM-DD)
+            
+        Returns:
+            Dict with api_key_id, api_key_last_used_at, tenant_id, status, plan,
+            monthly_usage and daily_usage, or None if no active key matches.
+            Tenant fields are None if the key's tenant (or its user) no longer exists.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    ak.id AS api_key_id,
+                    ak.last_used_at AS api_key_last_used_at,
+                    t.id AS tenant_id,
+                    t.status,
+                    t.plan,
+                    (SELECT COALESCE(SUM(requests_count), 0) FROM tenant_usage
+                     WHERE tenant_id = t.id AND period_start >= ? AND period_start <= ?) AS monthly_usage,
+                    (SELECT COALESCE(SUM(requests_count), 0) FROM tenant_usage
+                     WHERE tenant_id = t.id AND period_start = ?) AS daily_usage
+                FROM api_keys ak
+                LEFT JOIN tenants t ON t.id = ak.tenant_id
+                    AND EXISTS (SELECT 1 FROM users u WHERE u.id = t.user_id)
+                WHERE ak.key_hash = ? AND ak.status = 'active'
+            """, (month_start, today, today, key_hash))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
     # Memory: long-term preferences (KV per tenant)
     def write_preference(self, tenant_id: str, key: str, value: str) -> None:
         """Write a preference (intentional, governor-approved)."""
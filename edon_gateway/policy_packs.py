@@ -12,7 +12,11 @@ Preset modes:
 6. Autonomy Mode - High-risk full co-pilot
 """
 
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+import orjson
+
 from .schemas import RiskLevel
 
 
@@ -35,15 +39,29 @@ class PolicyPack:
         self.risk_level = risk_level
         self.approved_by_user = approved_by_user
 
-    def to_intent_dict(self, objective: str = None) -> Dict[str, Any]:
-        """Convert to intent contract dictionary."""
-        return {
-            "objective": objective or self.description,
-            "scope": self.scope,
-            "constraints": self.constraints,
-            "risk_level": self.risk_level.value,
-            "approved_by_user": self.approved_by_user
-        }
+        # Packs are immutable singletons: build the default intent once
+        self._intent_dict = MappingProxyType({
+            "objective": description,
+            "scope": scope,
+            "constraints": constraints,
+            "risk_level": risk_level.value,
+            "approved_by_user": approved_by_user
+        })
+        self._intent_json = orjson.dumps(dict(self._intent_dict))
+
+    def to_intent_dict(self, objective: str = None) -> Mapping[str, Any]:
+        """Convert to intent contract dictionary.
+
+        Without an objective this returns the shared read-only intent;
+        callers must copy it before modifying.
+        """
+        if not objective:
+            return self._intent_dict
+        return {**self._intent_dict, "objective": objective}
+
+    def to_intent_json(self) -> bytes:
+        """Default intent contract as pre-encoded JSON bytes."""
+        return self._intent_json
 
 
 # Mode 1: Casual User (Ultra-Safe / Everyday Use)
@@ -277,37 +295,47 @@ POLICY_PACKS = {
 }
 
 
+_AVAILABLE_STR = ", ".join(POLICY_PACKS)
+
+
 def get_policy_pack(name: str) -> PolicyPack:
     """Get a policy pack by name."""
-    if name not in POLICY_PACKS:
-        raise ValueError(
-            f"Unknown policy pack: {name}. "
-            f"Available: {list(POLICY_PACKS.keys())}"
-        )
-    return POLICY_PACKS[name]
+    pack = POLICY_PACKS.get(name)
+    if pack is None:
+        raise ValueError(f"Unknown policy pack: {name}. Available: {_AVAILABLE_STR}")
+    return pack
 
 
-def list_policy_packs() -> List[Dict[str, Any]]:
-    """List all available policy packs."""
-    return [
-        {
-            "name": pack.name,
-            "description": pack.description,
-            "risk_level": pack.risk_level.value,
-            "scope_summary": {
-                tool: len(ops) for tool, ops in pack.scope.items()
-            },
-            "constraints_summary": {
-                "allowed_tools": len(pack.constraints.get("allowed_clawdbot_tools", [])),
-                "blocked_tools": len(pack.constraints.get("blocked_clawdbot_tools", [])),
-                "confirm_required": "confirm_on" in pack.constraints
-            }
+# Pack summaries never change after import
+_POLICY_PACK_LIST: List[Dict[str, Any]] = [
+    {
+        "name": pack.name,
+        "description": pack.description,
+        "risk_level": pack.risk_level.value,
+        "scope_summary": {
+            tool: len(ops) for tool, ops in pack.scope.items()
+        },
+        "constraints_summary": {
+            "allowed_tools": len(pack.constraints.get("allowed_clawdbot_tools", [])),
+            "blocked_tools": len(pack.constraints.get("blocked_clawdbot_tools", [])),
+            "confirm_required": "confirm_on" in pack.constraints
         }
-        for pack in POLICY_PACKS.values()
-    ]
+    }
+    for pack in POLICY_PACKS.values()
+]
 
 
-def apply_policy_pack(pack_name: str, objective: str = None) -> Dict[str, Any]:
+def list_policy_packs() -> List[Dict[str, Any]]:
+    """List all available policy packs (shared list; do not modify)."""
+    return _POLICY_PACK_LIST
+
+
+def apply_policy_pack(pack_name: str, objective: str = None) -> Mapping[str, Any]:
     """Apply a policy pack and return intent contract dictionary."""
     pack = get_policy_pack(pack_name)
     return pack.to_intent_dict(objective)
+
+
+def apply_policy_pack_json(pack_name: str) -> bytes:
+    """Apply a policy pack and return its default intent contract as JSON bytes."""
+    return get_policy_pack(pack_name).to_intent_json()
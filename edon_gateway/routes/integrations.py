@@ -1,16 +1,26 @@
 """Integration routes for EDON Gateway."""
 
-from fastapi import APIRouter, Request, HTTPException, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+import asyncio
+import hashlib
+import threading
+import time
+
+import orjson
+
+from fastapi import APIRouter, BackgroundTasks, Request, HTTPException, Form
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta, UTC
 from ..schemas.integrations import ClawdbotConnectRequest, ClawdbotConnectResponse
 from ..persistence import get_db
-from ..connectors.clawdbot_connector import ClawdbotConnector
+from ..connectors.clawdbot_connector import ClawdbotConnector, PROBE_TIMEOUT
 from ..logging_config import get_logger
 from ..config import config
 from ..tenancy import get_request_tenant_id
+from ..middleware.auth import add_key_prefix
+from ..security.anti_bypass import invalidate_clawdbot_credentials_cache
+from ..security.network_gating import validate_network_gating, get_clawdbot_base_url
 
 logger = get_logger(__name__)
 
@@ -64,6 +74,48 @@ class GitHubTokenSubmitRequest(BaseModel):
     token: str
 
 
+# validate_network_gating() results per (base_url, network_gating_enabled).
+# Classification may involve a DNS lookup, and the integrations page polls.
+_GATING_CACHE: Dict[tuple, tuple] = {}  # key -> (expires_at, result)
+_GATING_CACHE_LOCK = threading.Lock()
+GATING_CACHE_TTL_SECONDS = 30
+GATING_CACHE_MAX_ENTRIES = 256
+
+
+def _validate_network_gating_cached(base_url: Optional[str], network_gating_enabled: bool) -> tuple:
+    """validate_network_gating() with a short TTL cache (called from the threadpool)."""
+    key = (base_url, network_gating_enabled)
+    now = time.monotonic()
+    with _GATING_CACHE_LOCK:
+        cached = _GATING_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = validate_network_gating(base_url, network_gating_enabled)
+    with _GATING_CACHE_LOCK:
+        if len(_GATING_CACHE) >= GATING_CACHE_MAX_ENTRIES:
+            _GATING_CACHE.clear()
+        _GATING_CACHE[key] = (now + GATING_CACHE_TTL_SECONDS, result)
+    return result
+
+
+# Encoded /account/integrations body for requests without a tenant. It only
+# depends on global state (default credential, active preset, gating config),
+# so anonymous polling is served from here; writes to that state invalidate it.
+_ANON_STATUS_CACHE: Dict[str, Any] = {"status": None, "expires_at": 0.0}
+ANON_STATUS_CACHE_TTL_SECONDS = 10
+
+
+def invalidate_integration_status_cache() -> None:
+    """Drop the cached no-tenant integration status."""
+    _ANON_STATUS_CACHE["status"] = None
+
+
+async def _none() -> None:
+    """Awaitable placeholder for an optional asyncio.gather() slot."""
+    return None
+
+
 def _resolve_connect_base_url(request: Request) -> str:
     """Base URL for connect pages (config or request base)."""
     base = config.CONNECT_BASE_URL
@@ -90,8 +142,19 @@ def _get_and_validate_service_code(code: str) -> Dict[str, Any]:
     return entry
 
 
+# Static, so encoded once
+_CONNECT_BUTTONS_JSON = orjson.dumps({
+    "services": CONNECT_SERVICES,
+    "telegram_inline_keyboard": TELEGRAM_CONNECT_KEYBOARD,
+})
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/connect/buttons")
-async def get_connect_buttons() -> Dict[str, Any]:
+async def get_connect_buttons() -> Response:
     """Return connect service buttons for Telegram /connect command.
 
     Use this from the Telegram bot to show which services users can connect
@@ -99,10 +162,7 @@ async def get_connect_buttons() -> Dict[str, Any]:
     Returns both a list of services (id, label, type) and a ready-to-use
     Telegram inline keyboard (inline_keyboard format).
     """
-    return {
-        "services": CONNECT_SERVICES,
-        "telegram_inline_keyboard": TELEGRAM_CONNECT_KEYBOARD,
-    }
+    return _json_response(_CONNECT_BUTTONS_JSON)
 
 
 @router.post("/connect/link")
@@ -399,23 +459,69 @@ async def connect_google_calendar_callback(request: Request, state: str = "", co
     return RedirectResponse(url=f"{base}/integrations/connect/success?service=Google%20Calendar", status_code=302)
 
 
+def _scoped_clawdbot_credential_id(credential_id: Optional[str], tenant_id: Optional[str]) -> str:
+    """Resolve the stored credential id for a Clawdbot connect request.
+
+    Empty and legacy "clawdbot_gateway" ids map to the default credential;
+    any other id is suffixed with the tenant so tenants never share a row.
+    """
+    default_cred_id = config.DEFAULT_CLAWDBOT_CREDENTIAL_ID
+    credential_id = (credential_id or "").strip() or default_cred_id
+    if credential_id == "clawdbot_gateway" or credential_id == default_cred_id:
+        return default_cred_id
+    return f"{credential_id}_{tenant_id}" if tenant_id else credential_id
+
+
+async def _probe_and_record(
+    credential_id: str,
+    tenant_id: Optional[str],
+    base_url: str,
+    auth_mode: str,
+    secret: str,
+) -> None:
+    """Background Clawdbot probe; records the outcome on the saved credential."""
+    connector = ClawdbotConnector.from_inline(base_url=base_url, auth_mode=auth_mode, secret=secret)
+    try:
+        result = await connector.ainvoke(
+            tool="sessions_list", action="json", args={}, timeout=PROBE_TIMEOUT
+        )
+        error = None if result.get("success") else f"Edonbot probe failed: {result.get('error', 'Unknown error')}"
+    except RuntimeError as e:
+        # Gateway answered with an HTTP error (e.g. bad secret) - expected, no traceback
+        logger.warning("Background Clawdbot probe failed: %s", e)
+        error = f"Edonbot probe failed: {str(e)}"
+    except Exception as e:
+        logger.error("Background Clawdbot probe failed: %s", e, exc_info=True)
+        error = f"Edonbot probe failed: {str(e)}"
+
+    db = get_db()
+    await asyncio.to_thread(
+        db.update_credential_status, credential_id, tenant_id, success=error is None, error_message=error
+    )
+    invalidate_integration_status_cache()
+
+
 @router.post("/clawdbot/connect", response_model=ClawdbotConnectResponse)
-async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest):
+async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest, background_tasks: BackgroundTasks):
     """Connect Edonbot (bot gateway) integration.
     
     Validates connection by calling sessions_list (if probe=true), then stores credentials.
+    With async_probe=true the credential is saved first and the probe runs after
+    the response is sent.
     
     Args:
         request: FastAPI request (auth middleware populates tenant_id)
         body: Connection details
+        background_tasks: Runs the deferred probe (async_probe=true)
         
     Returns:
         Connection status and credential info
     """
     tenant_id = get_request_tenant_id(request)
+    probe_inline = body.probe and not body.async_probe
     
     # Optional probe before saving
-    if body.probe:
+    if probe_inline:
         try:
             # Create an ephemeral connector instance using provided creds (not DB)
             connector = ClawdbotConnector.from_inline(
@@ -424,7 +530,9 @@ async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest):
                 secret=body.secret,
             )
             # Minimal probe: sessions_list
-            result = connector.invoke(tool="sessions_list", action="json", args={})
+            result = await connector.ainvoke(
+                tool="sessions_list", action="json", args={}, timeout=PROBE_TIMEOUT
+            )
             if not result.get("success"):
                 raise HTTPException(
                     status_code=400,
@@ -432,8 +540,13 @@ async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest):
                 )
         except HTTPException:
             raise
+        except RuntimeError as e:
+            # Gateway answered with an HTTP error (e.g. bad secret); network
+            # failures come back as a result from ainvoke. Expected, so no traceback.
+            logger.warning("Clawdbot probe failed: %s", e)
+            raise HTTPException(status_code=400, detail=f"Edonbot probe failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Clawdbot probe failed: {str(e)}", exc_info=True)
+            logger.error("Clawdbot probe failed: %s", e, exc_info=True)
             raise HTTPException(status_code=400, detail=f"Edonbot probe failed: {str(e)}")
     
     # Save credential in EDON DB (tenant-scoped if tenant_id exists)
@@ -444,12 +557,7 @@ async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest):
         "secret": body.secret,
     }
     
-    default_cred_id = config.DEFAULT_CLAWDBOT_CREDENTIAL_ID
-    credential_id = (body.credential_id or "").strip() or default_cred_id
-    if credential_id == "clawdbot_gateway":
-        credential_id = default_cred_id
-    if tenant_id and credential_id != default_cred_id:
-        credential_id = f"{credential_id}_{tenant_id}"
+    credential_id = _scoped_clawdbot_credential_id(body.credential_id, tenant_id)
     
     db.save_credential(
         credential_id=credential_id,
@@ -457,23 +565,41 @@ async def connect_clawdbot(request: Request, body: ClawdbotConnectRequest):
         credential_type="gateway",
         credential_data=credential_data,
         encrypted=True,
-        tenant_id=tenant_id
+        tenant_id=tenant_id,
+        mark_ok=probe_inline,  # probe already succeeded; record it in the same write
     )
-    if body.probe:
-        db.update_credential_status(credential_id, tenant_id, success=True, error_message=None)
-    logger.info(f"Edonbot connected successfully. Credential ID: {credential_id}, Tenant: {tenant_id}")
+    invalidate_clawdbot_credentials_cache()
+    invalidate_integration_status_cache()
+    logger.info("Edonbot connected successfully. Credential ID: %s, Tenant: %s", credential_id, tenant_id)
+    
+    message = "Edonbot connected. Credential saved."
+    if body.probe and body.async_probe:
+        background_tasks.add_task(
+            _probe_and_record, credential_id, tenant_id, body.base_url, body.auth_mode, body.secret
+        )
+        message = "Edonbot credential saved. Connection probe running in background."
     
     return ClawdbotConnectResponse(
         connected=True,
         credential_id=credential_id,
         base_url=body.base_url,
         auth_mode=body.auth_mode,
-        message="Edonbot connected. Credential saved.",
+        message=message,
     )
 
 
+@router.get("/health")
+async def integrations_health() -> Response:
+    """Cheap liveness check for integration dashboards (no DB or network access).
+
+    Poll this for liveness and only fetch /integrations/account/integrations
+    when the integration state is expected to have changed.
+    """
+    return _json_response(orjson.dumps({"ok": True, "ts": time.time()}))
+
+
 @router.get("/account/integrations")
-async def get_integration_status(request: Request) -> Dict[str, Any]:
+async def get_integration_status(request: Request) -> Response:
     """Get integration status for current tenant.
     
     Returns:
@@ -488,37 +614,43 @@ async def get_integration_status(request: Request) -> Dict[str, Any]:
     """
     try:
         tenant_id = get_request_tenant_id(request)
-        db = get_db()
-
-        # Get Clawdbot integration status
-        integration_status = db.get_integration_status(tenant_id, tool_name="clawdbot")
-
-        # Get active policy pack
-        active_preset = db.get_active_policy_preset()
+        if tenant_id is None:
+            cached = _ANON_STATUS_CACHE["status"]
+            if cached is not None and _ANON_STATUS_CACHE["expires_at"] > time.monotonic():
+                return _json_response(cached)
 
-        # Get tenant default intent
-        default_intent_id = None
-        if tenant_id:
-            default_intent_id = db.get_tenant_default_intent(tenant_id)
+        db = get_db()
 
-        # Network gating status
-        from ..security.network_gating import validate_network_gating, get_clawdbot_base_url
+        # DB reads are blocking sqlite calls; run them in the threadpool so the
+        # event loop keeps serving other requests. The integration status,
+        # active policy pack and tenant default intent are independent, so
+        # fetch them concurrently.
+        integration_status, active_preset, default_intent_id = await asyncio.gather(
+            asyncio.to_thread(db.get_integration_status, tenant_id, "clawdbot"),
+            asyncio.to_thread(db.get_active_policy_preset),
+            asyncio.to_thread(db.get_tenant_default_intent, tenant_id) if tenant_id else _none(),
+        )
 
-        base_url = integration_status.get("base_url") or get_clawdbot_base_url()
+        # Network gating status (falls back to the default gateway URL)
+        stored_base_url = integration_status["base_url"]
+        base_url = stored_base_url or await asyncio.to_thread(get_clawdbot_base_url)
         network_gating_enabled = config.NETWORK_GATING
 
-        is_valid, reachability, risk, recommendation = validate_network_gating(
+        # May resolve DNS for the gateway host (cached briefly per base_url)
+        is_valid, reachability, risk, recommendation = await asyncio.to_thread(
+            _validate_network_gating_cached,
             base_url,
             network_gating_enabled
         )
 
+        # db.get_integration_status always returns every key
         clawdbot_status = {
-            "connected": integration_status.get("connected", False),
-            "base_url": integration_status.get("base_url"),
-            "auth_mode": integration_status.get("auth_mode"),
-            "last_ok_at": integration_status.get("last_ok_at"),
-            "last_error": integration_status.get("last_error"),
-            "active_policy_pack": active_preset.get("preset_name") if active_preset else None,
+            "connected": integration_status["connected"],
+            "base_url": stored_base_url,
+            "auth_mode": integration_status["auth_mode"],
+            "last_ok_at": integration_status["last_ok_at"],
+            "last_error": integration_status["last_error"],
+            "active_policy_pack": active_preset["preset_name"] if active_preset else None,
             "default_intent_id": default_intent_id,
             "network_gating_enabled": network_gating_enabled,
             "clawdbot_reachability": reachability,
@@ -526,10 +658,14 @@ async def get_integration_status(request: Request) -> Dict[str, Any]:
             "recommendation": recommendation if risk == "high" else None
         }
 
-        return {"clawdbot": clawdbot_status}
+        body = orjson.dumps({"clawdbot": clawdbot_status})
+        if tenant_id is None:
+            _ANON_STATUS_CACHE["status"] = body
+            _ANON_STATUS_CACHE["expires_at"] = time.monotonic() + ANON_STATUS_CACHE_TTL_SECONDS
+        return _json_response(body)
 
     except Exception as e:
-        logger.error(f"Failed to get integration status: {str(e)}", exc_info=True)
+        logger.error("Failed to get integration status: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get integration status: {str(e)}"
@@ -608,6 +744,7 @@ async def verify_telegram_connect_code(request: Request, body: TelegramVerifyCod
         channel="telegram",
         external_user_id=str(body.user_id),
     )
+    add_key_prefix(hashlib.sha256(token_info["raw_token"].encode()).hexdigest())
     return {
         "tenant_id": tenant_id,
         "token": token_info["raw_token"],
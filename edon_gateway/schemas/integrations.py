@@ -13,6 +13,11 @@ class ClawdbotConnectRequest(BaseModel):
     secret: str = Field(..., description="Gateway password or token depending on auth_mode")
     credential_id: str = Field("clawdbot_gateway", description="Credential id to store under")
     probe: bool = Field(True, description="If true, validate by calling /tools/invoke before saving")
+    async_probe: bool = Field(
+        False,
+        description="If true (with probe), save immediately and run the probe in the background; "
+                    "the result shows up as last_ok_at/last_error in /integrations/account/integrations",
+    )
 
 
 class ClawdbotConnectResponse(BaseModel):
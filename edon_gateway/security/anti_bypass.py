@@ -8,29 +8,45 @@ Two approaches:
 2. Token Hardening: Clawdbot tokens stored only in EDON, never exposed to agents
 """
 
-import os
 import logging
+import time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from ..config import config as gateway_config
+
 logger = logging.getLogger(__name__)
 
 
 class AntiBypassConfig:
     """Configuration for anti-bypass measures."""
     
+    __slots__ = (
+        "network_gating_enabled",
+        "token_hardening_enabled",
+        "credentials_strict",
+        "_recommendations",
+        "_status",
+        "_score",
+    )
+    
     def __init__(self):
+        # Flags come from the already-parsed gateway config, so they always
+        # agree with what the rest of the gateway enforces
+        
         # Network gating: If enabled, Clawdbot Gateway should only be accessible
         # from EDON Gateway's network (not from public internet)
-        self.network_gating_enabled = os.getenv("EDON_NETWORK_GATING", "false").lower() == "true"
+        self.network_gating_enabled = gateway_config.NETWORK_GATING
         
         # Token hardening: If enabled, Clawdbot tokens are NEVER exposed to agents
         # They're only stored in EDON database and used internally
-        self.token_hardening_enabled = os.getenv("EDON_TOKEN_HARDENING", "true").lower() == "true"
+        self.token_hardening_enabled = gateway_config.TOKEN_HARDENING
         
         # Credential strict mode: Requires all credentials in database
         # This is a prerequisite for token hardening
-        self.credentials_strict = os.getenv("EDON_CREDENTIALS_STRICT", "false").lower() == "true"
+        self.credentials_strict = gateway_config.CREDENTIALS_STRICT
         
         # Validation: Token hardening requires credentials strict mode
         if self.token_hardening_enabled and not self.credentials_strict:
@@ -39,32 +55,49 @@ class AntiBypassConfig:
                 "Token hardening requires strict credential mode. "
                 "Setting EDON_CREDENTIALS_STRICT=true is recommended."
             )
-    
-    def is_bypass_resistant(self) -> bool:
-        """Check if anti-bypass measures are active."""
-        return self.network_gating_enabled or self.token_hardening_enabled
-    
-    def get_security_status(self) -> Dict[str, Any]:
-        """Get current security configuration status."""
-        return {
-            "network_gating": {
+        
+        # Flags never change after construction, so everything derived from
+        # them is computed once here
+        self._recommendations = tuple(self._compute_recommendations())
+        self._status = MappingProxyType({
+            "network_gating": MappingProxyType({
                 "enabled": self.network_gating_enabled,
                 "description": "Clawdbot Gateway on private network, only EDON can access"
-            },
-            "token_hardening": {
+            }),
+            "token_hardening": MappingProxyType({
                 "enabled": self.token_hardening_enabled,
                 "description": "Clawdbot tokens stored only in EDON, never exposed to agents"
-            },
-            "credentials_strict": {
+            }),
+            "credentials_strict": MappingProxyType({
                 "enabled": self.credentials_strict,
                 "description": "All credentials must be in database (required for token hardening)"
-            },
+            }),
             "bypass_resistant": self.is_bypass_resistant(),
-            "recommendations": self._get_recommendations()
-        }
+        })
+        self._score = self._compute_score()
+    
+    def is_bypass_resistant(self) -> bool:
+        """Check if anti-bypass measures are active."""
+        return self.network_gating_enabled or self.token_hardening_enabled
+    
+    def get_security_status(self) -> Dict[str, Any]:
+        """Get current security configuration status."""
+        status = {key: dict(value) if isinstance(value, MappingProxyType) else value
+                  for key, value in self._status.items()}
+        status["recommendations"] = list(self._recommendations)
+        return status
+    
+    def get_score(self) -> Dict[str, Any]:
+        """Get the config-derived bypass resistance score (see get_bypass_resistance_score)."""
+        score = dict(self._score)
+        score["factors"] = list(score["factors"])
+        return score
     
     def _get_recommendations(self) -> list:
         """Get security recommendations based on current config."""
+        return list(self._recommendations)
+    
+    def _compute_recommendations(self) -> list:
         recommendations = []
         
         if not self.is_bypass_resistant():
@@ -84,6 +117,77 @@ class AntiBypassConfig:
             )
         
         return recommendations
+    
+    def _compute_score(self) -> MappingProxyType:
+        score = 0
+        factors = []
+        
+        # Network gating: 50 points
+        if self.network_gating_enabled:
+            score += 50
+            factors.append("Network gating enabled (+50)")
+        else:
+            factors.append("Network gating disabled (0)")
+        
+        # Token hardening: 40 points
+        if self.token_hardening_enabled:
+            score += 40
+            factors.append("Token hardening enabled (+40)")
+        else:
+            factors.append("Token hardening disabled (0)")
+        
+        # Credentials strict: 10 points
+        if self.credentials_strict:
+            score += 10
+            factors.append("Credentials strict mode enabled (+10)")
+        else:
+            factors.append("Credentials strict mode disabled (0)")
+        
+        return MappingProxyType({
+            "score": score,
+            "max_score": 100,
+            "factors": tuple(factors),
+            "level": _get_security_level(score),
+        })
+
+
+@lru_cache(maxsize=1)
+def _get_anti_bypass_config() -> AntiBypassConfig:
+    """Return the process-wide AntiBypassConfig.
+    
+    The flags do not change at runtime, so derived status is built (and the
+    strict-mode warning logged) once. Tests that patch the gateway config
+    call reset_anti_bypass_config().
+    """
+    return AntiBypassConfig()
+
+
+reset_anti_bypass_config = _get_anti_bypass_config.cache_clear
+
+
+# Whether any Clawdbot credential exists in the DB. Status dashboards poll the
+# anti-bypass endpoints, so the lookup is shared for a few seconds.
+_CLAWDBOT_CREDS_CACHE: Dict[str, Any] = {"present": None, "fetched_at": 0.0}
+CLAWDBOT_CREDS_CACHE_TTL_SECONDS = 10
+
+
+def _has_clawdbot_credentials() -> bool:
+    """Return True if Clawdbot credentials are stored (cached briefly)."""
+    now = time.monotonic()
+    present = _CLAWDBOT_CREDS_CACHE["present"]
+    if present is not None and now - _CLAWDBOT_CREDS_CACHE["fetched_at"] < CLAWDBOT_CREDS_CACHE_TTL_SECONDS:
+        return present
+
+    from ..persistence import get_db
+    present = bool(get_db().get_credentials_by_tool("clawdbot"))
+    _CLAWDBOT_CREDS_CACHE["present"] = present
+    _CLAWDBOT_CREDS_CACHE["fetched_at"] = now
+    return present
+
+
+def invalidate_clawdbot_credentials_cache() -> None:
+    """Drop the cached credential check (call after Clawdbot credentials change)."""
+    _CLAWDBOT_CREDS_CACHE["present"] = None
 
 
 def validate_anti_bypass_setup() -> Dict[str, Any]:
@@ -92,24 +196,21 @@ def validate_anti_bypass_setup() -> Dict[str, Any]:
     Returns:
         Validation result with status and recommendations
     """
-    config = AntiBypassConfig()
+    config = _get_anti_bypass_config()
     status = config.get_security_status()
     
     # Check if credentials are in database (for token hardening)
     credentials_ok = True
     if config.token_hardening_enabled:
         try:
-            from ..persistence import get_db
-            db = get_db()
-            clawdbot_creds = db.get_credentials_by_tool("clawdbot")
-            if not clawdbot_creds:
+            if not _has_clawdbot_credentials():
                 credentials_ok = False
                 status["warnings"] = [
                     "Token hardening enabled but no Clawdbot credentials found in database. "
                     "Set credentials via POST /credentials/set"
                 ]
         except Exception as e:
-            logger.error(f"Error checking credentials: {e}")
+            logger.error("Error checking credentials: %s", e)
             credentials_ok = False
     
     status["validation"] = {
@@ -125,49 +226,18 @@ def get_bypass_resistance_score() -> Dict[str, Any]:
     
     Higher score = more resistant to bypass attempts.
     """
-    config = AntiBypassConfig()
-    score = 0
-    factors = []
-    
-    # Network gating: 50 points
-    if config.network_gating_enabled:
-        score += 50
-        factors.append("Network gating enabled (+50)")
-    else:
-        factors.append("Network gating disabled (0)")
-    
-    # Token hardening: 40 points
-    if config.token_hardening_enabled:
-        score += 40
-        factors.append("Token hardening enabled (+40)")
-    else:
-        factors.append("Token hardening disabled (0)")
-    
-    # Credentials strict: 10 points
-    if config.credentials_strict:
-        score += 10
-        factors.append("Credentials strict mode enabled (+10)")
-    else:
-        factors.append("Credentials strict mode disabled (0)")
+    result = _get_anti_bypass_config().get_score()
     
     # Check if credentials actually exist
     try:
-        from ..persistence import get_db
-        db = get_db()
-        clawdbot_creds = db.get_credentials_by_tool("clawdbot")
-        if clawdbot_creds:
-            factors.append("Clawdbot credentials configured in database")
+        if _has_clawdbot_credentials():
+            result["factors"].append("Clawdbot credentials configured in database")
         else:
-            factors.append("WARNING: No Clawdbot credentials in database")
+            result["factors"].append("WARNING: No Clawdbot credentials in database")
     except:
         pass
     
-    return {
-        "score": score,
-        "max_score": 100,
-        "factors": factors,
-        "level": _get_security_level(score)
-    }
+    return result
 
 
 def _get_security_level(score: int) -> str:
@@ -251,3 +321,13 @@ Security Properties:
   - Even if agent code is compromised, tokens are safe
   - Tokens are rotated/changed in EDON, not in agent configs
 """
+
+
+# Guides are served verbatim as text/plain; encode once at import
+NETWORK_GATING_GUIDE_BYTES = NETWORK_GATING_GUIDE.encode("utf-8")
+TOKEN_HARDENING_GUIDE_BYTES = TOKEN_HARDENING_GUIDE.encode("utf-8")
+
+SETUP_GUIDES = {
+    "network-gating": NETWORK_GATING_GUIDE_BYTES,
+    "token-hardening": TOKEN_HARDENING_GUIDE_BYTES,
+}
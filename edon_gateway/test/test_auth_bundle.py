@@ -0,0 +1,101 @@
+"""Unit tests for the single-query API key + tenant + usage lookup."""
+
+import tempfile
+from pathlib import Path
+
+from edon_gateway.persistence.database import Database
+
+
+def test_auth_bundle_includes_tenant_and_usage():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        db.create_user(user_id="u1", email="u1@example.com", auth_provider="clerk", auth_subject="sub_1")
+        db.create_tenant(tenant_id="tenant_1", user_id="u1")
+        api_key_id = db.create_api_key("tenant_1", "hash_1", name="test")
+
+        with db._get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO tenant_usage (tenant_id, period_start, requests_count) VALUES (?, ?, ?)",
+                [
+                    ("tenant_1", "2026-02-28", 100),  # previous month
+                    ("tenant_1", "2026-03-01", 5),
+                    ("tenant_1", "2026-03-10", 7),
+                ],
+            )
+            conn.commit()
+
+        bundle = db.get_auth_bundle("hash_1", "2026-03-10", "2026-03-01")
+        assert bundle["api_key_id"] == api_key_id
+        assert bundle["tenant_id"] == "tenant_1"
+        assert bundle["status"] == "trial"
+        assert bundle["plan"] == "free"
+        assert bundle["monthly_usage"] == 12
+        assert bundle["daily_usage"] == 7
+
+        assert db.get_tenant_usage_summary("tenant_1", "2026-03-10", "2026-03-01") == {"monthly": 12, "daily": 7}
+        assert db.get_tenant_usage_summary("tenant_1", "2026-03-11", "2026-03-01") == {"monthly": 12, "daily": 0}
+
+        # Unknown or revoked keys resolve to nothing
+        assert db.get_auth_bundle("missing", "2026-03-10", "2026-03-01") is None
+        db.revoke_api_key(api_key_id)
+        assert db.get_auth_bundle("hash_1", "2026-03-10", "2026-03-01") is None
+    finally:
+        db_path.unlink(missing_ok=True)
+
+
+def test_unknown_token_hash_skips_db(monkeypatch):
+    """Hashes with no matching active key prefix are rejected without reloading on every call."""
+    from edon_gateway.middleware import auth as auth_module
+
+    class FakeDb:
+        calls = 0
+
+        def get_token_hash_prefixes(self, length):
+            FakeDb.calls += 1
+            return {"abcdef12"}
+
+    monkeypatch.setitem(auth_module._KEY_PREFIX_CACHE, "prefixes", None)
+    monkeypatch.setitem(auth_module._KEY_PREFIX_CACHE, "fetched_at", 0.0)
+    monkeypatch.setattr(auth_module, "KEY_PREFIX_REFRESH_SECONDS", 60)
+    db = FakeDb()
+
+    assert auth_module._may_be_db_token(db, "abcdef12" + "0" * 56)
+    assert not auth_module._may_be_db_token(db, "ffffffff" + "0" * 56)
+    assert not auth_module._may_be_db_token(db, "eeeeeeee" + "0" * 56)
+    assert FakeDb.calls == 1
+
+
+def test_new_api_key_authenticates_while_prefix_cache_is_warm(monkeypatch):
+    """A key created right after a prefix refresh must not be rejected by the filter."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from edon_gateway.billing import bootstrap
+    from edon_gateway.middleware import auth as auth_module
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        db.create_user(user_id="u1", email="u1@example.com", auth_provider="clerk", auth_subject="sub_1")
+        db.create_tenant(tenant_id="tenant_1", user_id="u1")
+        monkeypatch.setattr(auth_module, "get_db", lambda: db)
+        monkeypatch.setattr(bootstrap, "get_db", lambda: db)
+        monkeypatch.setitem(auth_module._KEY_PREFIX_CACHE, "prefixes", None)
+        monkeypatch.setitem(auth_module._KEY_PREFIX_CACHE, "fetched_at", 0.0)
+        monkeypatch.setattr(auth_module, "KEY_PREFIX_REFRESH_SECONDS", 60)
+
+        # Warm the cache: an unknown token loads the (empty) prefix set
+        assert auth_module.verify_token("not-a-key") == (False, None)
+
+        request = SimpleNamespace(state=SimpleNamespace(tenant_id="tenant_1"))
+        created = asyncio.run(bootstrap.create_api_key(request, {"name": "fresh"}))
+
+        ok, info = auth_module.verify_token(created["api_key"])
+        assert ok
+        assert info["tenant_id"] == "tenant_1"
+        assert info["api_key_id"] == created["api_key_id"]
+    finally:
+        db_path.unlink(missing_ok=True)
@@ -0,0 +1,73 @@
+"""Unit tests: the shared Clawdbot HTTP clients never carry cookies between calls."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from edon_gateway.connectors.clawdbot_connector import ClawdbotConnector, close_async_client
+
+
+class _CookieSettingGateway(BaseHTTPRequestHandler):
+    """Fake Clawdbot Gateway: sets a session cookie and records the Cookie header it receives."""
+
+    received_cookies = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.received_cookies.append(self.headers.get("Cookie"))
+        body = json.dumps({"ok": True, "result": {}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Set-Cookie", "gw_session=tenant-a; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def gateway_url():
+    _CookieSettingGateway.received_cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieSettingGateway)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_invoke_does_not_send_cookie_from_previous_call(gateway_url):
+    """A Set-Cookie on tenant A's invoke must not be sent on tenant B's next invoke."""
+    tenant_a = ClawdbotConnector.from_inline(gateway_url, "token", "secret-a")
+    tenant_b = ClawdbotConnector.from_inline(gateway_url, "token", "secret-b")
+
+    assert tenant_a.invoke("sessions_list")["success"] is True
+    assert tenant_b.invoke("sessions_list")["success"] is True
+
+    assert _CookieSettingGateway.received_cookies == [None, None]
+
+
+def test_ainvoke_does_not_send_cookie_from_previous_call(gateway_url):
+    """Same as above for the shared AsyncClient used by request handlers."""
+    tenant_a = ClawdbotConnector.from_inline(gateway_url, "token", "secret-a")
+    tenant_b = ClawdbotConnector.from_inline(gateway_url, "token", "secret-b")
+
+    async def invoke_both():
+        try:
+            first = await tenant_a.ainvoke("sessions_list")
+            second = await tenant_b.ainvoke("sessions_list")
+        finally:
+            await close_async_client()
+        return first, second
+
+    first, second = asyncio.run(invoke_both())
+
+    assert first["success"] is True and second["success"] is True
+    assert _CookieSettingGateway.received_cookies == [None, None]
@@ -71,3 +71,33 @@ def test_get_credential_order_by_rowid_desc():
         assert out["credential_data"]["secret"] == "only"
     finally:
         db_path.unlink(missing_ok=True)
+
+
+def test_save_credential_mark_ok_records_success():
+    """mark_ok=True stores the credential already marked as successfully checked."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        cred_data = {"base_url": "http://example.com", "secret": "s1", "auth_mode": "token"}
+        db.save_credential(
+            credential_id="clawdbot_gateway",
+            tool_name="clawdbot",
+            credential_type="gateway",
+            credential_data=cred_data,
+        )
+        assert db.get_integration_status(None)["connected"] is False
+
+        db.save_credential(
+            credential_id="clawdbot_gateway",
+            tool_name="clawdbot",
+            credential_type="gateway",
+            credential_data=cred_data,
+            mark_ok=True,
+        )
+        status = db.get_integration_status(None)
+        assert status["connected"] is True
+        assert status["last_ok_at"] is not None
+        assert status["last_error"] is None
+    finally:
+        db_path.unlink(missing_ok=True)
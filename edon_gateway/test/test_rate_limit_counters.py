@@ -0,0 +1,74 @@
+"""Unit tests for batched rate limit counter access."""
+
+import tempfile
+from pathlib import Path
+
+from edon_gateway.persistence.database import Database
+
+
+def test_increment_and_get_counters_batch():
+    """increment_counters upserts every key in one call; get_counters returns 0 for unknown keys."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        db.increment_counters([("a", 1), ("b", 2)])
+        db.increment_counters([("a", 1), ("c", 5)])
+
+        counts = db.get_counters(["a", "b", "c", "missing"])
+        assert counts == {"a": 2, "b": 2, "c": 5, "missing": 0}
+        # Batch and single-key accessors agree
+        assert db.get_counter("a") == 2
+        assert db.get_counters([]) == {}
+    finally:
+        db_path.unlink(missing_ok=True)
+
+
+def test_local_counts_enforced_before_flush(monkeypatch):
+    """Hits are counted in-process, enforced immediately, and persisted on flush."""
+    from edon_gateway.middleware import rate_limit
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        monkeypatch.setattr(rate_limit, "get_db", lambda: db)
+        monkeypatch.setattr(rate_limit, "RATE_LIMIT_ENABLED", True)
+        monkeypatch.setattr(rate_limit, "_local_counts", rate_limit.defaultdict(int))
+        monkeypatch.setattr(rate_limit, "_db_snapshot", {})
+        limits = {"per_minute": 2, "per_hour": 100, "per_day": 1000}
+
+        for _ in range(2):
+            assert rate_limit.check_rate_limit("agent-1", limits)[0]
+            rate_limit.increment_rate_limit("agent-1")
+
+        allowed, error = rate_limit.check_rate_limit("agent-1", limits)
+        assert not allowed
+        assert "per minute" in error
+        # Nothing written yet
+        minute_key = rate_limit.get_rate_limit_key("agent-1", "minute")
+        assert db.get_counter(minute_key) == 0
+
+        rate_limit.flush_rate_limit_counters()
+        assert db.get_counter(minute_key) == 2
+        assert not rate_limit.check_rate_limit("agent-1", limits)[0]
+    finally:
+        db_path.unlink(missing_ok=True)
+
+
+def test_increment_tenant_usages_batch():
+    """Tenant usage is upserted in one batch; unknown tenants are skipped without failing it."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    try:
+        db = Database(db_path)
+        db.create_user(user_id="u1", email="u1@example.com", auth_provider="clerk", auth_subject="sub_1")
+        db.create_tenant(tenant_id="tenant_1", user_id="u1")
+
+        db.increment_tenant_usages([("tenant_1", 3), ("tenant_missing", 4)], period_start="2026-03-10")
+        db.increment_tenant_usages([("tenant_1", 2)], period_start="2026-03-10")
+
+        assert db.get_tenant_usage("tenant_1", "2026-03-10") == 5
+        assert db.get_tenant_usage("tenant_missing", "2026-03-10") == 0
+    finally:
+        db_path.unlink(missing_ok=True)
@@ -40,7 +40,7 @@ Write-Host ""
 
 # Run Python tests
 Write-Host "Running production mode tests..." -ForegroundColor Cyan
-python edon_gateway/test_production_mode.py
+python -m pytest edon_gateway/test_production_mode.py --tb=short -q
 
 Write-Host ""
 Write-Host "============================================================" -ForegroundColor Cyan
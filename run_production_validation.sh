@@ -42,7 +42,7 @@ echo ""
 
 # Run Python tests
 echo "Running production mode tests..."
-python edon_gateway/test_production_mode.py
+python -m pytest edon_gateway/test_production_mode.py --tb=short -q
 
 echo ""
 echo "============================================================"
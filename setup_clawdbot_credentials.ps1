@@ -53,7 +53,7 @@ try {
     Write-Host "  Status: $($response.status)"
     Write-Host ""
     Write-Host "You can now run integration tests:" -ForegroundColor Cyan
-    Write-Host "  python edon_gateway/test_clawdbot_integration.py"
+    Write-Host "  pytest edon_gateway/test_clawdbot_integration.py -v"
     
 } catch {
     if ($_.Exception.Response) {
@@ -4,10 +4,27 @@ These tests validate that production security features work correctly:
 A) Strict credentials fail closed
 B) Validation rejects dangerous payloads
 C) Auth truly blocks protected endpoints
+
+Usage:
+    # Start the gateway with the production settings under test
+    export EDON_CREDENTIALS_STRICT=true
+    export EDON_VALIDATE_STRICT=true
+    export EDON_AUTH_ENABLED=true
+    export EDON_API_TOKEN=test-token
+    export EDON_GATEWAY_URL=http://localhost:8000
+
+    pytest test_production_mode.py --tb=short -q
+
+Tests keep no process-global state, so they can run under pytest-xdist
+(``pytest -n auto --dist=loadfile``).
 """
 
+import asyncio
+import logging
 import os
 import json
+import httpx
+import orjson
 import requests
 import pytest
 from pathlib import Path
@@ -16,23 +33,73 @@ import shutil
 
 BASE_URL = os.getenv("EDON_GATEWAY_URL", "http://localhost:8000")
 
+# Every test here talks to a live gateway
+pytestmark = [pytest.mark.live, pytest.mark.usefixtures("gateway_up")]
+
 # Test configuration
 TEST_CREDENTIAL_ID = "test-email-credential-001"
 TEST_AGENT_ID = "test-agent-001"
 TEST_INTENT_ID = "test-intent-001"
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.DEBUG)
+
+# Pre-encoded /execute envelope for email.draft; %s takes the JSON-encoded params
+_EMAIL_DRAFT_ENVELOPE = (
+    b'{"action": {"tool": "email", "op": "draft", "params": %s}, "agent_id": "'
+    + TEST_AGENT_ID.encode() + b'"}'
+)
+_ENVELOPE_HEAD, _ENVELOPE_TAIL = _EMAIL_DRAFT_ENVELOPE.split(b"%s")
+JSON_HEADERS = {"Content-Type": "application/json"}
+# 10,001-item array (one over the validator's limit), encoded once at import
+_HUGE_ARRAY_JSON = b"[0" + b",0" * 10000 + b"]"
+
+# (email body, expected error substring) cases for the dangerous-pattern test
+DANGEROUS_PAYLOADS = [
+    pytest.param("<script>alert('xss')</script>", "script", id="script_tag"),
+    pytest.param("javascript:alert('xss')", "javascript", id="javascript_protocol"),
+    pytest.param("<div onclick='alert(1)'>test</div>", "event", id="event_handler"),
+]
+
+
+class _StreamedBody:
+    """JSON body of known length whose filler is generated in 64KB chunks.
+
+    Having __len__ makes requests send a Content-Length header rather than
+    chunked encoding, while the body itself is never held in memory.
+    """
+
+    CHUNK = b"x" * 65536
+
+    def __init__(self, prefix: bytes, filler_size: int, suffix: bytes):
+        self.prefix = prefix
+        self.filler_size = filler_size
+        self.suffix = suffix
+
+    def __len__(self):
+        return len(self.prefix) + self.filler_size + len(self.suffix)
+
+    def __iter__(self):
+        yield self.prefix
+        remaining = self.filler_size
+        while remaining > 0:
+            chunk = self.CHUNK if remaining >= len(self.CHUNK) else self.CHUNK[:remaining]
+            remaining -= len(chunk)
+            yield chunk
+        yield self.suffix
+
 
 class TestStrictCredentials:
     """Test A: Strict credentials fail closed."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        # Enable strict mode
-        os.environ["EDON_CREDENTIALS_STRICT"] = "true"
+    @pytest.fixture(autouse=True)
+    def _strict_credentials(self, monkeypatch):
+        """Enable strict mode for the duration of each test."""
+        monkeypatch.setenv("EDON_CREDENTIALS_STRICT", "true")
         # Note: In real tests, you'd need to restart the server or use a test client
         # For now, we'll document the expected behavior
     
-    def test_credential_missing_fails_closed(self):
+    def test_credential_missing_fails_closed(self, http):
         """Test that missing credential returns 503 in strict mode.
         
         Steps:
@@ -47,12 +114,12 @@ class TestStrictCredentials:
         # First, ensure credential doesn't exist
         # DELETE /credentials/{credential_id} if it exists
         try:
-            requests.delete(f"{BASE_URL}/credentials/{TEST_CREDENTIAL_ID}")
-        except:
+            http.delete(f"{BASE_URL}/credentials/{TEST_CREDENTIAL_ID}")
+        except requests.RequestException:
             pass
         
         # Try to execute an action that requires a credential
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/execute",
             json={
                 "action": {
@@ -66,8 +133,7 @@ class TestStrictCredentials:
                 },
                 "agent_id": TEST_AGENT_ID,
                 "intent_id": TEST_INTENT_ID
-            },
-            headers={"X-EDON-TOKEN": os.getenv("EDON_API_TOKEN", "test-token")} if os.getenv("EDON_AUTH_ENABLED") == "true" else {}
+            }
         )
         
         # In strict mode, should get 503 if credential missing
@@ -78,8 +144,8 @@ class TestStrictCredentials:
         # Check that no execution artifact was created
         # (This would check the sandbox directory or execution result)
         
-        print(f"Response status: {response.status_code}")
-        print(f"Response body: {response.text}")
+        log.debug("Response status: %s", response.status_code)
+        log.debug("Response body: %s", response.text)
         
         # Expected: 503 Service Unavailable with credential error message
         assert response.status_code in [503, 500], f"Expected 503, got {response.status_code}: {response.text}"
@@ -90,364 +156,165 @@ class TestStrictCredentials:
 class TestValidationRejectsDangerousPayloads:
     """Test B: Validation rejects dangerous payloads."""
     
-    def test_oversized_body_rejected(self):
+    def test_oversized_body_rejected(self, http):
         """Test that >10MB body is rejected with 413."""
-        # Create a large payload (>10MB)
-        large_payload = {
-            "action": {
-                "tool": "email",
-                "op": "draft",
-                "params": {
-                    "body": "x" * (11 * 1024 * 1024)  # 11 MB
-                }
-            },
-            "agent_id": TEST_AGENT_ID
-        }
+        # Stream a large payload (>10MB) with a declared Content-Length
+        large_payload = _StreamedBody(
+            _ENVELOPE_HEAD + b'{"body": "',
+            11 * 1024 * 1024,  # 11 MB
+            b'"}' + _ENVELOPE_TAIL,
+        )
         
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/execute",
-            json=large_payload,
-            headers={"X-EDON-TOKEN": os.getenv("EDON_API_TOKEN", "test-token")} if os.getenv("EDON_AUTH_ENABLED") == "true" else {}
+            data=large_payload,
+            headers=JSON_HEADERS
         )
         
-        print(f"Oversized body test - Status: {response.status_code}")
-        print(f"Response: {response.text[:200]}")
+        log.debug("Oversized body test - Status: %s", response.status_code)
+        log.debug("Response: %.200s", response.text)
         
         # Should reject with 413 Request Entity Too Large
         assert response.status_code == 413, f"Expected 413, got {response.status_code}: {response.text}"
         assert "exceeds maximum" in response.text.lower() or "too large" in response.text.lower(), \
             f"Response should mention size limit: {response.text}"
     
-    def test_deep_json_nesting_rejected(self):
+    def test_deep_json_nesting_rejected(self, http):
         """Test that deep JSON nesting (>10 levels) is rejected with 400."""
-        # Create deeply nested JSON (11 levels)
-        def create_nested_dict(depth):
-            if depth == 0:
-                return {"value": "test"}
-            return {"nested": create_nested_dict(depth - 1)}
-        
-        deep_payload = {
-            "action": {
-                "tool": "email",
-                "op": "draft",
-                "params": create_nested_dict(11)  # 11 levels deep
-            },
-            "agent_id": TEST_AGENT_ID
-        }
+        # Build the 11-level nested JSON text directly; no intermediate dicts
+        depth = 11
+        deep_params = b'{"nested": ' * depth + b'{"value": "test"}' + b'}' * depth
         
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/execute",
-            json=deep_payload,
-            headers={"X-EDON-TOKEN": os.getenv("EDON_API_TOKEN", "test-token")} if os.getenv("EDON_AUTH_ENABLED") == "true" else {}
+            data=_EMAIL_DRAFT_ENVELOPE % deep_params,
+            headers=JSON_HEADERS
         )
         
-        print(f"Deep nesting test - Status: {response.status_code}")
-        print(f"Response: {response.text[:200]}")
+        log.debug("Deep nesting test - Status: %s", response.status_code)
+        log.debug("Response: %.200s", response.text)
         
         # Should reject with 400 Bad Request
         assert response.status_code == 400, f"Expected 400, got {response.status_code}: {response.text}"
         assert "depth" in response.text.lower() or "exceeds maximum" in response.text.lower(), \
             f"Response should mention depth limit: {response.text}"
     
-    def test_huge_array_rejected(self):
+    def test_huge_array_rejected(self, http):
         """Test that huge arrays (>10,000 items) are rejected with 400."""
-        # Create array with 10,001 items
-        huge_array = list(range(10001))
-        
-        payload = {
-            "action": {
-                "tool": "email",
-                "op": "draft",
-                "params": {
-                    "recipients": huge_array  # 10,001 items
-                }
-            },
-            "agent_id": TEST_AGENT_ID
-        }
-        
-        response = requests.post(
+        response = http.post(
             f"{BASE_URL}/execute",
-            json=payload,
-            headers={"X-EDON-TOKEN": os.getenv("EDON_API_TOKEN", "test-token")} if os.getenv("EDON_AUTH_ENABLED") == "true" else {}
+            data=_EMAIL_DRAFT_ENVELOPE % (b'{"recipients": ' + _HUGE_ARRAY_JSON + b'}'),
+            headers=JSON_HEADERS
         )
         
-        print(f"Huge array test - Status: {response.status_code}")
-        print(f"Response: {response.text[:200]}")
+        log.debug("Huge array test - Status: %s", response.status_code)
+        log.debug("Response: %.200s", response.text)
         
         # Should reject with 400 Bad Request
         assert response.status_code == 400, f"Expected 400, got {response.status_code}: {response.text}"
         assert "array length" in response.text.lower() or "exceeds maximum" in response.text.lower(), \
             f"Response should mention array limit: {response.text}"
     
-    def test_dangerous_patterns_rejected(self):
+    @pytest.mark.parametrize("body,expected_error", DANGEROUS_PAYLOADS)
+    def test_dangerous_patterns_rejected(self, http, body, expected_error):
         """Test that dangerous patterns (script tags, etc.) are rejected with 400."""
-        dangerous_payloads = [
-            {
-                "name": "script_tag",
-                "payload": {
-                    "action": {
-                        "tool": "email",
-                        "op": "draft",
-                        "params": {
-                            "body": "<script>alert('xss')</script>"
-                        }
-                    },
-                    "agent_id": TEST_AGENT_ID
-                },
-                "expected_error": "script"
-            },
-            {
-                "name": "javascript_protocol",
-                "payload": {
-                    "action": {
-                        "tool": "email",
-                        "op": "draft",
-                        "params": {
-                            "body": "javascript:alert('xss')"
-                        }
-                    },
-                    "agent_id": TEST_AGENT_ID
-                },
-                "expected_error": "javascript"
-            },
-            {
-                "name": "event_handler",
-                "payload": {
-                    "action": {
-                        "tool": "email",
-                        "op": "draft",
-                        "params": {
-                            "body": "<div onclick='alert(1)'>test</div>"
-                        }
-                    },
-                    "agent_id": TEST_AGENT_ID
-                },
-                "expected_error": "event"
-            }
-        ]
+        response = http.post(
+            f"{BASE_URL}/execute",
+            data=_EMAIL_DRAFT_ENVELOPE % orjson.dumps({"body": body}),
+            headers=JSON_HEADERS
+        )
         
-        for test_case in dangerous_payloads:
-            response = requests.post(
-                f"{BASE_URL}/execute",
-                json=test_case["payload"],
-                headers={"X-EDON-TOKEN": os.getenv("EDON_API_TOKEN", "test-token")} if os.getenv("EDON_AUTH_ENABLED") == "true" else {}
-            )
-            
-            print(f"Dangerous pattern test ({test_case['name']}) - Status: {response.status_code}")
-            print(f"Response: {response.text[:200]}")
-            
-            # Should reject with 400 Bad Request
-            assert response.status_code == 400, \
-                f"Expected 400 for {test_case['name']}, got {response.status_code}: {response.text}"
-            assert test_case["expected_error"] in response.text.lower(), \
-                f"Response should mention {test_case['expected_error']}: {response.text}"
+        log.debug("Dangerous pattern test (%s) - Status: %s", expected_error, response.status_code)
+        log.debug("Response: %.200s", response.text)
+        
+        # Should reject with 400 Bad Request
+        assert response.status_code == 400, \
+            f"Expected 400 for {body!r}, got {response.status_code}: {response.text}"
+        assert expected_error in response.text.lower(), \
+            f"Response should mention {expected_error}: {response.text}"
 
 
-class TestAuthBlocksProtectedEndpoints:
-    """Test C: Auth truly blocks protected endpoints."""
-    
-    def test_execute_requires_auth(self):
-        """Test that /execute requires authentication when enabled."""
-        # Make request without token
-        response = requests.post(
-            f"{BASE_URL}/execute",
-            json={
-                "action": {
-                    "tool": "email",
-                    "op": "draft",
-                    "params": {
-                        "recipients": ["test@example.com"],
-                        "subject": "Test",
-                        "body": "Test"
-                    }
-                },
-                "agent_id": TEST_AGENT_ID
+# (method, endpoint, request kwargs) for protected endpoints probed without a token
+PROTECTED_ENDPOINTS = [
+    ("POST", "/execute", {"json": {
+        "action": {
+            "tool": "email",
+            "op": "draft",
+            "params": {
+                "recipients": ["test@example.com"],
+                "subject": "Test",
+                "body": "Test"
             }
-            # No auth header
+        },
+        "agent_id": TEST_AGENT_ID
+    }}),
+    ("GET", "/audit/query", {"params": {"limit": 10}}),
+    ("GET", "/intent/get", {"params": {"intent_id": "test"}}),
+    ("POST", "/intent/set", {"json": {"objective": "test", "scope": {}, "constraints": {}}}),
+    ("POST", "/credentials/set", {"json": {"credential_id": "test", "tool_name": "email", "credential_type": "smtp", "credential_data": {}}}),
+    ("DELETE", "/credentials/test-id", {}),
+]
+# Credential readback is disabled for security; only SET and DELETE are available
+CREDENTIAL_READBACK_ENDPOINTS = [
+    pytest.param("/credentials/get/test-id", id="get"),
+    pytest.param("/credentials/tool/email", id="tool"),
+]
+
+
+async def _request_all_without_token(requests_spec):
+    """Send (method, endpoint, kwargs) requests concurrently on one unauthenticated client."""
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=httpx.Timeout(10.0, connect=2.0)) as client:
+        return await asyncio.gather(
+            *(client.request(method, endpoint, **kwargs) for method, endpoint, kwargs in requests_spec)
         )
-        
-        print(f"Execute without auth - Status: {response.status_code}")
-        print(f"Response: {response.text[:200]}")
-        
-        # If auth is enabled, should get 401 or 403
-        if os.getenv("EDON_AUTH_ENABLED", "false").lower() == "true":
-            assert response.status_code in [401, 403], \
-                f"Expected 401/403 when auth enabled, got {response.status_code}: {response.text}"
-            assert "token" in response.text.lower() or "unauthorized" in response.text.lower() or "forbidden" in response.text.lower(), \
-                f"Response should mention authentication: {response.text}"
-        else:
-            # If auth disabled, request should proceed (but may fail for other reasons)
-            print("Auth disabled - skipping auth check")
+
+
+class TestAuthBlocksProtectedEndpoints:
+    """Test C: Auth truly blocks protected endpoints."""
     
-    def test_audit_query_requires_auth(self):
-        """Test that /audit/query requires authentication when enabled."""
-        response = requests.get(
-            f"{BASE_URL}/audit/query",
-            params={"limit": 10}
-            # No auth header
-        )
-        
-        print(f"Audit query without auth - Status: {response.status_code}")
-        
-        if os.getenv("EDON_AUTH_ENABLED", "false").lower() == "true":
-            assert response.status_code in [401, 403], \
-                f"Expected 401/403 when auth enabled, got {response.status_code}: {response.text}"
+    @pytest.fixture(autouse=True)
+    def _skip_if_auth_off(self, request, auth_enabled):
+        """Skip auth-enforcement checks, before any request, when auth is disabled."""
+        if not auth_enabled and not request.node.get_closest_marker("auth_agnostic"):
+            pytest.skip("Auth disabled (EDON_AUTH_ENABLED != true)")
     
-    def test_credentials_endpoints_require_auth(self):
-        """Test that /credentials/* endpoints require authentication when enabled.
+    def test_endpoints_require_auth(self):
+        """Test that protected endpoints reject requests without a token when auth is enabled.
         
-        Note: Credential readback (GET) is disabled for security.
-        Only SET and DELETE operations are available.
+        The probes are independent, so they are sent concurrently and the test
+        costs roughly one round trip instead of one per endpoint.
         """
-        endpoints = [
-            ("POST", "/credentials/set"),
-            ("DELETE", "/credentials/test-id")
-        ]
+        responses = asyncio.run(_request_all_without_token(PROTECTED_ENDPOINTS))
         
-        for method, endpoint in endpoints:
-            if method == "POST":
-                response = requests.post(
-                    f"{BASE_URL}{endpoint}",
-                    json={"credential_id": "test", "tool_name": "email", "credential_type": "smtp", "credential_data": {}}
-                )
-            elif method == "DELETE":
-                response = requests.delete(f"{BASE_URL}{endpoint}")
-            
-            print(f"{method} {endpoint} without auth - Status: {response.status_code}")
+        for (method, endpoint, _), response in zip(PROTECTED_ENDPOINTS, responses):
+            log.debug("%s %s without auth - Status: %s", method, endpoint, response.status_code)
             
-            if os.getenv("EDON_AUTH_ENABLED", "false").lower() == "true":
-                assert response.status_code in [401, 403], \
-                    f"Expected 401/403 for {method} {endpoint}, got {response.status_code}: {response.text}"
-        
-        # Verify credential readback is disabled (should return 404, not 401)
-        readback_endpoints = [
-            ("GET", "/credentials/get/test-id"),
-            ("GET", "/credentials/tool/email")
-        ]
-        
-        for method, endpoint in readback_endpoints:
-            response = requests.get(f"{BASE_URL}{endpoint}")
-            print(f"{method} {endpoint} (readback disabled) - Status: {response.status_code}")
-            # Readback endpoints should return 404 (not found) since they're disabled
-            assert response.status_code == 404, \
-                f"Credential readback should be disabled (404), got {response.status_code}: {response.text}"
+            assert response.status_code in [401, 403], \
+                f"Expected 401/403 for {method} {endpoint}, got {response.status_code}: {response.text}"
+            text = response.text.lower()
+            assert "token" in text or "unauthorized" in text or "forbidden" in text, \
+                f"Response should mention authentication for {method} {endpoint}: {response.text}"
     
-    def test_intent_endpoints_require_auth(self):
-        """Test that /intent/* endpoints require authentication when enabled."""
-        endpoints = [
-            ("GET", "/intent/get", {"intent_id": "test"}),
-            ("POST", "/intent/set", {"objective": "test", "scope": {}, "constraints": {}})
-        ]
-        
-        for method, endpoint, params in endpoints:
-            if method == "GET":
-                response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-            elif method == "POST":
-                response = requests.post(f"{BASE_URL}{endpoint}", json=params)
-            
-            print(f"{method} {endpoint} without auth - Status: {response.status_code}")
-            
-            if os.getenv("EDON_AUTH_ENABLED", "false").lower() == "true":
-                assert response.status_code in [401, 403], \
-                    f"Expected 401/403 for {method} {endpoint}, got {response.status_code}: {response.text}"
+    @pytest.mark.auth_agnostic
+    @pytest.mark.parametrize("endpoint", CREDENTIAL_READBACK_ENDPOINTS)
+    def test_credential_readback_disabled(self, http_noauth, endpoint):
+        """Verify credential readback is disabled (should return 404, not 401)."""
+        response = http_noauth.get(f"{BASE_URL}{endpoint}")
+        log.debug("GET %s (readback disabled) - Status: %s", endpoint, response.status_code)
+        # Readback endpoints should return 404 (not found) since they're disabled
+        assert response.status_code == 404, \
+            f"Credential readback should be disabled (404), got {response.status_code}: {response.text}"
     
-    def test_health_endpoint_stays_open(self):
+    @pytest.mark.auth_agnostic
+    def test_health_endpoint_stays_open(self, http_noauth):
         """Test that /health endpoint remains accessible without auth."""
-        response = requests.get(f"{BASE_URL}/health")
+        response = http_noauth.get(f"{BASE_URL}/health")
         
-        print(f"Health check - Status: {response.status_code}")
-        print(f"Response: {response.json() if response.status_code == 200 else response.text}")
+        log.debug("Health check - Status: %s", response.status_code)
+        log.debug("Response: %s", response.text)
         
         # Health should always be accessible (200 OK)
         assert response.status_code == 200, \
             f"Health endpoint should be accessible, got {response.status_code}: {response.text}"
         assert "status" in response.json(), "Health response should have status field"
 
-
-def run_production_mode_tests():
-    """Run all production mode validation tests.
-    
-    Usage:
-        # Set environment variables
-        export EDON_CREDENTIALS_STRICT=true
-        export EDON_VALIDATE_STRICT=true
-        export EDON_AUTH_ENABLED=true
-        export EDON_API_TOKEN=test-token
-        export EDON_GATEWAY_URL=http://localhost:8000
-        
-        # Run tests
-        python edon_gateway/test_production_mode.py
-    """
-    print("=" * 70)
-    print("Production Mode Security Validation Tests")
-    print("=" * 70)
-    print()
-    
-    # Check environment
-    print("Environment Configuration:")
-    print(f"  EDON_CREDENTIALS_STRICT: {os.getenv('EDON_CREDENTIALS_STRICT', 'not set')}")
-    print(f"  EDON_VALIDATE_STRICT: {os.getenv('EDON_VALIDATE_STRICT', 'not set')}")
-    print(f"  EDON_AUTH_ENABLED: {os.getenv('EDON_AUTH_ENABLED', 'not set')}")
-    print(f"  EDON_GATEWAY_URL: {BASE_URL}")
-    print()
-    
-    # Run tests
-    test_classes = [
-        ("A) Strict Credentials", TestStrictCredentials),
-        ("B) Validation Rejects Dangerous Payloads", TestValidationRejectsDangerousPayloads),
-        ("C) Auth Blocks Protected Endpoints", TestAuthBlocksProtectedEndpoints),
-    ]
-    
-    results = {"passed": 0, "failed": 0, "errors": []}
-    
-    for test_suite_name, test_class in test_classes:
-        print(f"\n{'=' * 70}")
-        print(f"Running: {test_suite_name}")
-        print(f"{'=' * 70}\n")
-        
-        test_instance = test_class()
-        test_methods = [m for m in dir(test_instance) if m.startswith("test_")]
-        
-        for test_method in test_methods:
-            try:
-                print(f"  Running: {test_method}...")
-                getattr(test_instance, test_method)()
-                print(f"  ✓ PASSED: {test_method}\n")
-                results["passed"] += 1
-            except AssertionError as e:
-                print(f"  ✗ FAILED: {test_method}")
-                print(f"    {str(e)}\n")
-                results["failed"] += 1
-                results["errors"].append(f"{test_suite_name}::{test_method}: {str(e)}")
-            except Exception as e:
-                print(f"  ✗ ERROR: {test_method}")
-                print(f"    {str(e)}\n")
-                results["failed"] += 1
-                results["errors"].append(f"{test_suite_name}::{test_method}: {str(e)}")
-    
-    # Summary
-    print("\n" + "=" * 70)
-    print("Test Summary")
-    print("=" * 70)
-    print(f"Passed: {results['passed']}")
-    print(f"Failed: {results['failed']}")
-    print(f"Total: {results['passed'] + results['failed']}")
-    
-    if results["errors"]:
-        print("\nErrors:")
-        for error in results["errors"]:
-            print(f"  - {error}")
-    
-    print("\n" + "=" * 70)
-    
-    if results["failed"] > 0:
-        print("❌ Some tests failed. Review errors above.")
-        return 1
-    else:
-        print("✅ All tests passed!")
-        return 0
-
-
-if __name__ == "__main__":
-    import sys
-    sys.exit(run_production_mode_tests())
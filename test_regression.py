@@ -11,12 +11,23 @@ NOTE:
   into /clawdbot/invoke so we never clobber the real/dev default credential.
 - Restoring the original Clawdbot integration is best-effort and only attempted when
   a real secret is available via env var.
+
+The tests are independent network probes and can run in parallel with pytest-xdist:
+    pytest test_regression.py -n 4 --dist loadgroup
+The two tests that connect Clawdbot credentials share the "clawdbot_integration"
+xdist group, so one worker runs them in sequence around a single snapshot/restore.
 """
 
+import asyncio
 import os
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
 import requests
 import pytest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = os.getenv("EDON_GATEWAY_URL", "http://localhost:8000").rstrip("/")
 
@@ -36,6 +47,39 @@ TEST_CRED_503 = os.getenv("EDON_TEST_CLAWDBOT_CRED_ID_503", "clawdbot_gateway_do
 # Dedicated tenant for regression tests
 TEST_TENANT_ID = os.getenv("EDON_TEST_TENANT_ID", "tenant_dev")
 
+# Set EDON_TEST_DEBUG to print extra integration diagnostics
+TEST_DEBUG = bool(os.getenv("EDON_TEST_DEBUG"))
+
+# Traceback markers and file paths that must never appear in a response body.
+# One case-insensitive pass over the raw bytes instead of lowercasing and rescanning.
+_LEAK_RE = re.compile(rb'traceback|file "|c:\\|/users/|/home/', re.IGNORECASE)
+
+# Sent on every EDON Gateway call: JSON bodies, the test tenant and, when auth is on, the token.
+# Per-call headers (X-Agent-ID, X-Intent-ID) are merged over these and never drop the tenant.
+_BASE_HEADERS = {"Content-Type": "application/json", "X-Tenant-ID": TEST_TENANT_ID}
+if AUTH_ENABLED and AUTH_TOKEN:
+    _BASE_HEADERS["X-EDON-TOKEN"] = AUTH_TOKEN
+
+@pytest.fixture(scope="session")
+def http(gateway_session):
+    """Keep-alive session for every gateway call, sending _BASE_HEADERS by default."""
+    return gateway_session(
+        base_url=BASE_URL,
+        headers=_BASE_HEADERS,
+        adapter=HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # Transient gateway/proxy failures are retried here, not in the tests
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.1,
+                status_forcelist=(502, 504),
+                allowed_methods=frozenset({"GET", "POST"}),
+                raise_on_status=False,
+            ),
+        ),
+    )
+
 
 def _assert_auth_ready():
     if not AUTH_ENABLED:
@@ -44,26 +88,11 @@ def _assert_auth_ready():
         raise SystemExit("EDON_API_TOKEN is missing/placeholder. Set EDON_API_TOKEN to a valid token.")
 
 
-def edon_headers(extra=None):
-    """Headers for EDON Gateway requests. Includes X-EDON-TOKEN when auth enabled and X-Tenant-ID always."""
-    h = {"Content-Type": "application/json", "X-Tenant-ID": TEST_TENANT_ID}
-    if AUTH_ENABLED and AUTH_TOKEN:
-        h["X-EDON-TOKEN"] = AUTH_TOKEN
-    if extra:
-        # do not allow accidental removal of tenant header
-        h.update(extra)
-        if "X-Tenant-ID" not in h:
-            h["X-Tenant-ID"] = TEST_TENANT_ID
-    return h
-
-
-def _get_current_clawdbot_integration_status():
+def _get_current_clawdbot_integration_status(http):
     """Best-effort: fetch current Clawdbot integration status (does NOT include secret)."""
     try:
-        r = requests.get(
+        r = http.get(
             f"{BASE_URL}/integrations/account/integrations",
-            headers=edon_headers(),
-            timeout=10,
         )
         if r.status_code != 200:
             return {}
@@ -73,7 +102,7 @@ def _get_current_clawdbot_integration_status():
         return {}
 
 
-def _restore_clawdbot_integration_best_effort(saved_status):
+def _restore_clawdbot_integration_best_effort(http, saved_status):
     """
     Best-effort restore. This only restores if:
     - saved_status contains a base_url/auth_mode
@@ -88,7 +117,7 @@ def _restore_clawdbot_integration_best_effort(saved_status):
         return
 
     try:
-        requests.post(
+        http.post(
             f"{BASE_URL}/integrations/clawdbot/connect",
             json={
                 "base_url": base_url,
@@ -96,32 +125,51 @@ def _restore_clawdbot_integration_best_effort(saved_status):
                 "secret": CLAWDBOT_GATEWAY_SECRET,
                 "probe": False,
             },
-            headers=edon_headers(),
-            timeout=10,
         )
     except Exception:
         pass
 
 
-def _apply_pack(agent_id: str):
-    """Apply policy pack and return intent_id or skip."""
-    r = requests.post(
+@pytest.fixture(scope="session")
+def saved_clawdbot_integration(http):
+    """Snapshot the Clawdbot integration once, then restore it (best effort) after the run."""
+    saved = _get_current_clawdbot_integration_status(http)
+    yield saved
+    _restore_clawdbot_integration_best_effort(http, saved)
+
+
+def _apply_pack(http, agent_id: str) -> str:
+    """Apply policy pack for agent_id and return its intent_id; skip the test if it fails."""
+    r = http.post(
         f"{BASE_URL}/policy-packs/clawdbot_safe/apply",
         json={},
-        headers=edon_headers(extra={"X-Agent-ID": agent_id}),
-        timeout=10,
+        headers={"X-Agent-ID": agent_id},
     )
     if r.status_code != 200:
-        return ("skip", f"apply returned {r.status_code}: {r.text[:200]}")
+        pytest.skip(f"apply returned {r.status_code}: {r.text[:200]}")
     intent_id = (r.json() or {}).get("intent_id")
     if not intent_id:
-        return ("skip", "Apply response missing intent_id")
+        pytest.skip("Apply response missing intent_id")
     return intent_id
 
 
-def _connect_test_credential(*, credential_id: str, base_url: str, secret: str, auth_mode: str = "token"):
+@pytest.fixture(scope="session")
+def intent_id_for(http):
+    """Return intent_id_for(agent_id), applying the policy pack at most once per agent."""
+    # agent_id -> intent_id from a successful policy-pack apply, shared for the whole run
+    applied = {}
+
+    def intent_id_for(agent_id: str) -> str:
+        if agent_id not in applied:
+            applied[agent_id] = _apply_pack(http, agent_id)
+        return applied[agent_id]
+
+    return intent_id_for
+
+
+def _connect_test_credential(http, *, credential_id: str, base_url: str, secret: str, auth_mode: str = "token"):
     """Connect a test-only credential."""
-    return requests.post(
+    return http.post(
         f"{BASE_URL}/integrations/clawdbot/connect",
         json={
             "credential_id": credential_id,
@@ -130,30 +178,27 @@ def _connect_test_credential(*, credential_id: str, base_url: str, secret: str,
             "secret": secret,
             "probe": False,
         },
-        headers=edon_headers(),
-        timeout=10,
     )
 
 
-def _invoke_with_cred(*, intent_id: str, agent_id: str, credential_id: str, tool: str, args=None):
+def _invoke_with_cred(http, *, intent_id: str, agent_id: str, credential_id: str, tool: str, args=None):
     """Invoke Clawdbot tool via EDON, explicitly specifying credential_id."""
-    return requests.post(
+    return http.post(
         f"{BASE_URL}/clawdbot/invoke",
-        headers=edon_headers(extra={"X-Intent-ID": intent_id, "X-Agent-ID": agent_id}),
+        headers={"X-Intent-ID": intent_id, "X-Agent-ID": agent_id},
         json={
             "credential_id": credential_id,
             "tool": tool,
             "action": "json",
             "args": args or {},
         },
-        timeout=15,
     )
 
 
-def test_no_traceback_leakage():
+def test_no_traceback_leakage(http):
     print("Testing: No traceback leakage...")
 
-    response = requests.post(
+    response = http.post(
         f"{BASE_URL}/execute",
         json={
             "action": {
@@ -167,56 +212,45 @@ def test_no_traceback_leakage():
             },
             "agent_id": "test-agent-001",
         },
-        headers=edon_headers(),
-        timeout=15,
     )
 
+    leak = _LEAK_RE.search(response.content)
+    assert leak is None, f"Response contains {leak.group(0)!r}: {response.text}"
     response_text = response.text.lower()
-    assert "traceback" not in response_text, f"Response contains 'traceback': {response.text}"
-    assert 'file "' not in response_text, f"Response contains file path: {response.text}"
-    assert "c:\\" not in response_text, f"Response contains Windows path: {response.text}"
-    if "detail" in response_text:
-        prefix = response_text.split("detail", 1)[0]
-        assert "line " not in prefix, f"Response contains line numbers: {response.text}"
-    else:
-        assert "line " not in response_text[:200], f"Response contains line numbers: {response.text}"
+    # Text before the first "detail" key, or the first 200 chars if there is none
+    idx = response_text.find("detail")
+    prefix = response_text[:idx] if idx >= 0 else response_text[:200]
+    assert "line " not in prefix, f"Response contains line numbers: {response.text}"
 
     print(f"  [OK] No traceback leakage (status: {response.status_code})")
 
 
-def test_clawdbot_invoke_persists_decision_or_audit():
+def test_clawdbot_invoke_persists_decision_or_audit(http, intent_id_for):
     print("Testing: Clawdbot invoke persists decision/audit...")
 
-    intent_id = _apply_pack("regression-test-agent")
-    if isinstance(intent_id, tuple):
-        pytest.skip(intent_id[1])
+    intent_id = intent_id_for("regression-test-agent")
 
     # Use the real/dev credential for this one (it’s a positive-path regression)
-    invoke_resp = requests.post(
+    invoke_resp = http.post(
         f"{BASE_URL}/clawdbot/invoke",
-        headers=edon_headers(extra={"X-Agent-ID": "regression-test-agent", "X-Intent-ID": intent_id}),
+        headers={"X-Agent-ID": "regression-test-agent", "X-Intent-ID": intent_id},
         json={"tool": "sessions_list", "action": "json", "args": {}},
-        timeout=15,
     )
     assert invoke_resp.status_code == 200, f"Invoke failed: {invoke_resp.status_code} {invoke_resp.text}"
     invoke_data = invoke_resp.json() or {}
     assert "edon_verdict" in invoke_data, f"Invoke response missing edon_verdict: {invoke_data}"
 
-    dec_resp = requests.get(
+    dec_resp = http.get(
         f"{BASE_URL}/decisions/query",
         params={"intent_id": intent_id, "limit": 10},
-        headers=edon_headers(),
-        timeout=10,
     )
     assert dec_resp.status_code == 200, f"Decisions query failed: {dec_resp.status_code}"
     dec_data = dec_resp.json() or {}
     decisions_total = dec_data.get("total", len(dec_data.get("decisions", [])))
 
-    audit_resp = requests.get(
+    audit_resp = http.get(
         f"{BASE_URL}/audit/query",
         params={"intent_id": intent_id, "limit": 10},
-        headers=edon_headers(),
-        timeout=10,
     )
     assert audit_resp.status_code == 200, f"Audit query failed: {audit_resp.status_code}"
     audit_data = audit_resp.json() or {}
@@ -229,7 +263,9 @@ def test_clawdbot_invoke_persists_decision_or_audit():
     print(f"  [OK] Clawdbot invoke persistence: decisions={decisions_total}, audit={audit_total}")
 
 
-def test_clawdbot_wrong_token_401_clean_error():
+@pytest.mark.xdist_group("clawdbot_integration")
+@pytest.mark.usefixtures("saved_clawdbot_integration")
+def test_clawdbot_wrong_token_401_clean_error(http, intent_id_for):
     """
     Wrong Clawdbot secret must yield a clean 401 path.
 
@@ -238,13 +274,10 @@ def test_clawdbot_wrong_token_401_clean_error():
     """
     print("Testing: Clawdbot wrong token yields clean 401 error path...")
 
-    saved = _get_current_clawdbot_integration_status()
-
-    intent_id = _apply_pack("regression-test-agent")
-    if isinstance(intent_id, tuple):
-        pytest.skip(intent_id[1])
+    intent_id = intent_id_for("regression-test-agent")
 
     connect_resp = _connect_test_credential(
+        http,
         credential_id=TEST_CRED_WRONG_TOKEN,
         base_url=CLAWDBOT_GATEWAY_URL,
         secret="wrong_secret_never_valid",
@@ -254,56 +287,47 @@ def test_clawdbot_wrong_token_401_clean_error():
     connect_json = connect_resp.json() or {}
     used_credential_id = connect_json.get("credential_id") or TEST_CRED_WRONG_TOKEN
 
-    try:
-        invoke_resp = _invoke_with_cred(
-            intent_id=intent_id,
-            agent_id="regression-test-agent",
-            credential_id=used_credential_id,
-            tool="sessions_list",
-            args={},
-        )
+    invoke_resp = _invoke_with_cred(
+        http,
+        intent_id=intent_id,
+        agent_id="regression-test-agent",
+        credential_id=used_credential_id,
+        tool="sessions_list",
+        args={},
+    )
 
-        assert invoke_resp.headers.get("content-type", "").startswith("application/json"), (
-            f"Expected JSON response, got {invoke_resp.headers.get('content-type')}"
-        )
-        # In CI there is no Clawdbot at 127.0.0.1:18789, so we get 503 (downstream unavailable).
-        # Skip when downstream is unreachable; only assert 401 when we actually reached Clawdbot.
-        if invoke_resp.status_code == 503:
-            err_text = (invoke_resp.text or "").lower()
-            if "connection refused" in err_text or "max retries exceeded" in err_text or "failed to establish" in err_text:
-                pytest.skip(f"Clawdbot not running (got 503): {invoke_resp.text[:150]}")
-        assert invoke_resp.status_code == 401, (
-            f"Expected 401, got {invoke_resp.status_code}: {invoke_resp.text}"
-        )
+    assert invoke_resp.headers.get("content-type", "").startswith("application/json"), (
+        f"Expected JSON response, got {invoke_resp.headers.get('content-type')}"
+    )
+    # In CI there is no Clawdbot at 127.0.0.1:18789, so we get 503 (downstream unavailable).
+    # Skip when downstream is unreachable; only assert 401 when we actually reached Clawdbot.
+    if invoke_resp.status_code == 503:
+        err_text = (invoke_resp.text or "").lower()
+        if "connection refused" in err_text or "max retries exceeded" in err_text or "failed to establish" in err_text:
+            pytest.skip(f"Clawdbot not running (got 503): {invoke_resp.text[:150]}")
+    assert invoke_resp.status_code == 401, (
+        f"Expected 401, got {invoke_resp.status_code}: {invoke_resp.text}"
+    )
 
-        data = invoke_resp.json() or {}
-        blob = json.dumps(data).lower()
-        assert "traceback" not in blob, f"Traceback leaked in error: {data}"
-        assert 'file "' not in blob and "c:\\" not in blob and "/users/" not in blob and "/home/" not in blob, (
-            f"File path leaked in error: {data}"
-        )
+    leak = _LEAK_RE.search(invoke_resp.content)
+    assert leak is None, f"{leak.group(0)!r} leaked in error: {invoke_resp.text}"
 
-        print("  [OK] Wrong token yields clean 401 error (no traceback)")
-    finally:
-        _restore_clawdbot_integration_best_effort(saved)
+    print("  [OK] Wrong token yields clean 401 error (no traceback)")
 
 
-def test_clawdbot_sessions_smoke():
+def test_clawdbot_sessions_smoke(http, intent_id_for):
     print("Testing: Clawdbot sessions_get, sessions_create, sessions_update smoke...")
 
-    intent_id = _apply_pack("regression-sessions-smoke")
-    if isinstance(intent_id, tuple):
-        pytest.skip(intent_id[1])
+    intent_id = intent_id_for("regression-sessions-smoke")
 
     # Positive-path smoke uses default/dev credential
-    h = edon_headers(extra={"X-Agent-ID": "regression-sessions-smoke", "X-Intent-ID": intent_id})
+    h = {"X-Agent-ID": "regression-sessions-smoke", "X-Intent-ID": intent_id}
 
     def invoke(tool, args=None):
-        r = requests.post(
+        r = http.post(
             f"{BASE_URL}/clawdbot/invoke",
             headers=h,
             json={"tool": tool, "action": "json", "args": args or {}},
-            timeout=15,
         )
         try:
             body = r.json()
@@ -315,34 +339,46 @@ def test_clawdbot_sessions_smoke():
     if not ok_list:
         pytest.skip(f"sessions_list failed (Clawdbot may be down): {r_list.text[:200]}")
 
-    ok_get, r_get = invoke("sessions_get", {"sessionKey": "main"})
-    assert r_get.status_code == 200, f"sessions_get failed: {r_get.status_code} {r_get.text}"
-
-    ok_create, r_create = invoke("sessions_create", {})
-    assert r_create.status_code == 200, f"sessions_create failed: {r_create.status_code} {r_create.text}"
+    # With sessions_list known to work, the remaining calls are independent; send them together
+    calls = [
+        ("sessions_get", {"sessionKey": "main"}),
+        ("sessions_create", {}),
+        ("sessions_update", {"sessionKey": "main"}),
+    ]
 
-    ok_update, r_update = invoke("sessions_update", {"sessionKey": "main"})
-    assert r_update.status_code == 200, f"sessions_update failed: {r_update.status_code} {r_update.text}"
+    async def invoke_all():
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers={**_BASE_HEADERS, **h},
+            # Same (connect, read) budget as the requests session
+            timeout=httpx.Timeout(http.timeout[1], connect=http.timeout[0]),
+        ) as client:
+            return await asyncio.gather(*(
+                client.post("/clawdbot/invoke", json={"tool": tool, "action": "json", "args": args})
+                for tool, args in calls
+            ))
+
+    for (tool, _), r in zip(calls, asyncio.run(invoke_all())):
+        assert r.status_code == 200, f"{tool} failed: {r.status_code} {r.text}"
 
     print("  [OK] sessions_get, sessions_create, sessions_update smoke")
 
 
-def test_503_preserved():
+@pytest.mark.xdist_group("clawdbot_integration")
+@pytest.mark.usefixtures("saved_clawdbot_integration")
+def test_503_preserved(http, intent_id_for):
     """
     Test that ALLOW + downstream unavailable yields HTTP 503.
     Deterministic: uses a dedicated dead credential_id and invokes with that credential_id.
     """
     print("Testing: 503 status code preservation (ALLOW + downstream unavailable -> 503)...")
 
-    saved = _get_current_clawdbot_integration_status()
-
-    intent_id = _apply_pack("test-agent-503")
-    if isinstance(intent_id, tuple):
-        pytest.skip(intent_id[1])
+    intent_id = intent_id_for("test-agent-503")
 
     dead_url = "http://127.0.0.1:1"
 
     connect_resp = _connect_test_credential(
+        http,
         credential_id=TEST_CRED_503,
         base_url=dead_url,
         secret="irrelevant",
@@ -352,39 +388,36 @@ def test_503_preserved():
     connect_json = connect_resp.json() or {}
     used_credential_id = connect_json.get("credential_id") or TEST_CRED_503
 
-    # Optional sanity print
-    check_resp = requests.get(
-        f"{BASE_URL}/integrations/account/integrations",
-        headers=edon_headers(),
-        timeout=10,
-    )
-    print("DEBUG integrations/account/integrations status:", check_resp.status_code)
-    try:
-        check_json = check_resp.json()
-    except Exception:
-        check_json = {}
-    print("DEBUG clawdbot integration after connect:", json.dumps((check_json or {}).get("clawdbot"), indent=2))
+    # Optional sanity print (costs an extra round trip, so only with EDON_TEST_DEBUG set)
+    if TEST_DEBUG:
+        check_resp = http.get(
+            f"{BASE_URL}/integrations/account/integrations",
+        )
+        print("DEBUG integrations/account/integrations status:", check_resp.status_code)
+        try:
+            check_json = check_resp.json()
+        except Exception:
+            check_json = {}
+        print("DEBUG clawdbot integration after connect:", json.dumps((check_json or {}).get("clawdbot"), indent=2))
 
-    try:
         print("DEBUG invoking with tenant:", TEST_TENANT_ID)
 
-        response = _invoke_with_cred(
-            intent_id=intent_id,
-            agent_id="test-agent-503",
-            credential_id=used_credential_id,
-            tool="sessions_list",
-            args={},
-        )
+    response = _invoke_with_cred(
+        http,
+        intent_id=intent_id,
+        agent_id="test-agent-503",
+        credential_id=used_credential_id,
+        tool="sessions_list",
+        args={},
+    )
 
-        assert response.status_code == 503, (
-            f"Expected 503 (ALLOW + downstream unavailable), got {response.status_code}: {response.text}"
-        )
-        print("  [OK] 503 status code preserved (ALLOW + downstream unavailable -> 503)")
-    finally:
-        _restore_clawdbot_integration_best_effort(saved)
+    assert response.status_code == 503, (
+        f"Expected 503 (ALLOW + downstream unavailable), got {response.status_code}: {response.text}"
+    )
+    print("  [OK] 503 status code preserved (ALLOW + downstream unavailable -> 503)")
 
 
-def test_no_file_paths_in_errors():
+def test_no_file_paths_in_errors(http):
     print("Testing: No file paths in error messages...")
 
     test_cases = [
@@ -392,149 +425,71 @@ def test_no_file_paths_in_errors():
         {"action": {}, "agent_id": "test"},
     ]
 
-    for test_case in test_cases:
+    # Independent probes: send them together (the session pool gives each its own socket)
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as pool:
+        futures = [pool.submit(http.post, f"{BASE_URL}/execute", json=test_case) for test_case in test_cases]
+
+    for future in as_completed(futures):
         try:
-            response = requests.post(
-                f"{BASE_URL}/execute",
-                json=test_case,
-                headers=edon_headers(),
-                timeout=15,
-            )
-            response_text = response.text.lower()
-
-            assert "c:\\" not in response_text, f"Response contains Windows path: {response.text}"
-            assert "/users/" not in response_text and "/home/" not in response_text, (
-                f"Response contains Unix path: {response.text}"
-            )
-
-            tail = response_text.split("detail")[-1][:200]
-            assert ".py" not in tail, f"Response contains Python file reference: {response.text}"
-        except Exception:
-            pass
+            response = future.result()
+        except requests.RequestException:
+            continue
+        leak = _LEAK_RE.search(response.content)
+        assert leak is None, f"Response contains {leak.group(0)!r}: {response.text}"
+
+        response_text = response.text.lower()
+        # Up to 200 chars after the last "detail", or the first 200 if there is none
+        idx = response_text.rfind("detail")
+        start = idx + len("detail") if idx >= 0 else 0
+        tail = response_text[start:start + 200]
+        assert ".py" not in tail, f"Response contains Python file reference: {response.text}"
 
     print("  [OK] No file paths in error messages")
 
 
-def test_error_envelope_consistency():
+def test_error_envelope_consistency(http):
     print("Testing: Error envelope consistency...")
 
     error_scenarios = [
-        (lambda: requests.post(
+        (lambda: http.post(
             f"{BASE_URL}/execute",
             json={"action": {}, "agent_id": "test"},
-            headers=edon_headers(),
-            timeout=10,
         ), None),
-        (lambda: requests.post(
+        (lambda: http.post(
             f"{BASE_URL}/execute",
             json={
                 "action": {"tool": "email", "op": "draft", "params": {"body": "<script>alert(1)</script>"}},
                 "agent_id": "test",
             },
-            headers=edon_headers(),
-            timeout=10,
         ), None),
     ]
 
     for make_request, _expected_status in error_scenarios:
         try:
             response = make_request()
+        except requests.RequestException:
+            continue
 
-            ct = response.headers.get("content-type", "")
-            if not ct.startswith("application/json"):
-                if response.status_code >= 400:
-                    assert False, f"Error response should be JSON. status={response.status_code} ct={ct} body={response.text[:200]}"
-                continue
+        ct = response.headers.get("content-type", "")
+        if not ct.startswith("application/json"):
+            if response.status_code >= 400:
+                assert False, f"Error response should be JSON. status={response.status_code} ct={ct} body={response.text[:200]}"
+            continue
 
+        if response.status_code >= 400:
             data = response.json()
-            if response.status_code >= 400:
-                assert "detail" in data, f"Error response should have 'detail' field: {data}"
-                assert isinstance(data["detail"], str), f"Error detail should be string: {data}"
-        except Exception:
-            pass
+            assert "detail" in data, f"Error response should have 'detail' field: {data}"
+            assert isinstance(data["detail"], str), f"Error detail should be string: {data}"
 
     print("  [OK] Error envelope consistency")
 
 
-def run_regression_tests():
-    _assert_auth_ready()
-
-    print("=" * 70)
-    print("Production Safety Regression Tests")
-    print("=" * 70)
-    print()
-
-    tests = [
-        ("No Traceback Leakage", test_no_traceback_leakage),
-        ("Clawdbot invoke persists decision/audit", test_clawdbot_invoke_persists_decision_or_audit),
-        ("Clawdbot wrong token 401 clean error", test_clawdbot_wrong_token_401_clean_error),
-        ("Clawdbot sessions smoke (get/create/update)", test_clawdbot_sessions_smoke),
-        ("503 Status Preserved", test_503_preserved),
-        ("No File Paths in Errors", test_no_file_paths_in_errors),
-        ("Error Envelope Consistency", test_error_envelope_consistency),
-    ]
-
-    results = {"passed": 0, "failed": 0, "skipped": 0, "errors": [], "skipped_reasons": []}
-
-    for test_name, test_func in tests:
-        try:
-            print(f"\n{test_name}:")
-            out = test_func()
-            if isinstance(out, tuple) and len(out) == 2 and out[0] == "skip":
-                results["skipped"] += 1
-                results["skipped_reasons"].append(f"{test_name}: {out[1]}")
-            else:
-                results["passed"] += 1
-        except AssertionError as e:
-            print(f"  [FAIL] FAILED: {str(e)}")
-            results["failed"] += 1
-            results["errors"].append(f"{test_name}: {str(e)}")
-        except BaseException as e:
-            # pytest skip exception class differs across versions
-            skip_exc = getattr(pytest, "SkipTest", None)
-            if skip_exc and isinstance(e, skip_exc):
-                results["skipped"] += 1
-                results["skipped_reasons"].append(f"{test_name}: {e}")
-                continue
-            if e.__class__.__name__.lower().startswith("skip"):
-                results["skipped"] += 1
-                results["skipped_reasons"].append(f"{test_name}: {e}")
-                continue
-            if isinstance(e, SystemExit):
-                raise
-            print(f"  [FAIL] ERROR: {str(e)}")
-            results["failed"] += 1
-            results["errors"].append(f"{test_name}: {str(e)}")
-
-    print("\n" + "=" * 70)
-    print("Regression Test Summary")
-    print("=" * 70)
-    print(f"Passed: {results['passed']}")
-    print(f"Failed: {results['failed']}")
-    print(f"Skipped: {results['skipped']}")
-    print(f"Total: {results['passed'] + results['failed'] + results['skipped']}")
-
-    if results["errors"]:
-        print("\nErrors:")
-        for error in results["errors"]:
-            print(f"  - {error}")
-
-    if results["skipped_reasons"]:
-        print("\nSkipped reasons:")
-        for reason in results["skipped_reasons"]:
-            print(f"  - {reason}")
-
-    if results["failed"] > 0:
-        print("\n[FAIL] Some regression tests failed!")
-        return 1
-
-    if results["skipped"] > 0:
-        print("\n[OK] All runnable tests passed (some skipped: Clawdbot not available).")
-    else:
-        print("\n[OK] All regression tests passed!")
-    return 0
-
-
 if __name__ == "__main__":
     import sys
-    sys.exit(run_regression_tests())
+    from importlib.util import find_spec
+
+    _assert_auth_ready()
+    args = [__file__, "-v", "-rs", "--tb=short"]
+    if find_spec("xdist"):
+        args += ["-n", "4", "--dist", "loadgroup"]
+    sys.exit(pytest.main(args))
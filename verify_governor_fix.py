@@ -21,13 +21,9 @@ except Exception as e:
 # Test 2: Does get_intent properly exclude intent_id?
 try:
     from edon_gateway.governor import EDONGovernor
-    from edon_gateway.persistence import get_db
     
-    db = get_db()
-    governor = EDONGovernor(db=db)
-    
-    # Check method exists
-    assert hasattr(governor, 'get_intent')
+    # Check method exists (on the class; no governor or database needed)
+    assert "get_intent" in vars(EDONGovernor)
     print("Test 2 PASS: governor.get_intent method exists")
 except Exception as e:
     print(f"Test 2 FAIL: {e}")